@@ -2,144 +2,304 @@
 Backend validation API for map layers and system health
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, request
+import hashlib
+import json
 import time
 import logging
-from typing import Dict, Any, List
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import wraps
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resolved once at import so the health check never pays import cost on a request
+# thread; a missing dependency is reported by validate_backend_health instead.
+try:
+    import requests  # noqa: F401 - presence is part of the health check
+    from config import get_config
+    _HEALTH_IMPORT_ERROR: Optional[str] = None
+except ImportError as e:
+    get_config = None  # type: ignore[assignment]
+    _HEALTH_IMPORT_ERROR = str(e)
 
 # Create blueprint
 validation_bp = Blueprint('validation', __name__, url_prefix='/api/validation')
 
 logger = logging.getLogger(__name__)
 
-def validate_backend_health() -> Dict[str, Any]:
+# Independent validators are fanned out on a shared pool so an aggregate
+# request costs roughly the slowest check rather than the sum of all three.
+# Sized for several concurrent aggregate requests, three validators each.
+VALIDATOR_POOL_WORKERS = 32
+_VALIDATOR_POOL = ThreadPoolExecutor(max_workers=VALIDATOR_POOL_WORKERS, thread_name_prefix='validation')
+VALIDATOR_TIMEOUT_SECONDS = 0.5
+
+# Successful GET results change slowly; let pollers and proxies revalidate cheaply
+VALIDATION_CACHE_CONTROL = "public, max-age=5, stale-while-revalidate=30"
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a response payload with sorted keys, using orjson when installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the json module still encodes
+            pass
+    return json.dumps(obj, sort_keys=True, separators=(',', ':')).encode()
+
+def _json_response(obj: Any, status: int = 200) -> Response:
+    """Build a JSON response without going through jsonify"""
+    return Response(_dumps(obj), status=status, mimetype='application/json')
+
+def _strip_timestamps(obj: Any) -> Any:
+    """Drop timestamp fields so unchanged results hash to the same ETag"""
+    if isinstance(obj, dict):
+        return {key: _strip_timestamps(value) for key, value in obj.items() if key != "timestamp"}
+    return obj
+
+def _etag_for(obj: Any) -> str:
+    """Content hash of a validation result, ignoring when it was produced"""
+    return hashlib.blake2b(_dumps(_strip_timestamps(obj)), digest_size=8).hexdigest()
+
+def _cacheable(response: Response, etag: str) -> Response:
+    """Attach the ETag and a short shared-cache lifetime to a response"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = VALIDATION_CACHE_CONTROL
+    return response
+
+def _not_modified(etag: str) -> Response:
+    """304 for a client that already holds the current result"""
+    return _cacheable(Response(status=304), etag)
+
+def _validation_response(result: Dict[str, Any], status: int) -> Response:
+    """JSON response for GET validators; successful results support conditional GET"""
+    if status != 200:
+        return _json_response(result, status)
+    etag = _etag_for(result)
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag)
+    return _cacheable(_json_response(result, status), etag)
+
+def _timeout_result(now: float) -> Dict[str, Any]:
+    """Result reported for a validator that missed its deadline"""
+    return {
+        "success": False,
+        "timestamp": now,
+        "error": "timeout"
+    }
+
+# Validator runs currently in progress, keyed by validator name
+_INFLIGHT: Dict[str, "Future[Dict[str, Any]]"] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+def single_flight(func: Callable[[Optional[float]], Dict[str, Any]]) -> Callable[[Optional[float]], Dict[str, Any]]:
+    """Share one in-progress validator run among all concurrent callers
+    
+    The validators only take the request timestamp, so a run started for one request
+    answers every request that arrives while it is in progress. Followers get a copy
+    stamped with their own timestamp (the validator's optional now argument); they wait
+    at most VALIDATOR_TIMEOUT_SECONDS, like run_validators, and then report a timeout.
+    """
+    name = func.__name__
+    
+    @wraps(func)
+    def wrapper(now: Optional[float] = None) -> Dict[str, Any]:
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(name)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                _INFLIGHT[name] = future
+        
+        if not is_leader:
+            if now is None:
+                now = time.time()
+            try:
+                result = future.result(timeout=VALIDATOR_TIMEOUT_SECONDS)
+            except FutureTimeoutError:
+                logger.warning(f"Validator '{name}' exceeded {VALIDATOR_TIMEOUT_SECONDS}s deadline")
+                return _timeout_result(now)
+            return {**result, "timestamp": now}
+        
+        try:
+            result = func(now)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _INFLIGHT_LOCK:
+                _INFLIGHT.pop(name, None)
+    
+    return wrapper
+
+# Internal endpoints are assumed available until real probing is added, so both the
+# result and its serialized form are built once; only the timestamp is filled per hit.
+API_ENDPOINTS_TO_TEST = ("/api/health", "/api/hazards", "/api/units", "/api/routes", "/api/buildings")
+_API_ENDPOINTS_STATIC: Dict[str, Dict[str, Any]] = {
+    endpoint: {"available": True, "response_time": 0.1}  # Mock response time
+    for endpoint in API_ENDPOINTS_TO_TEST
+}
+_TIMESTAMP_PLACEHOLDER = b'"__TS__"'
+_API_ENDPOINTS_BODY = _dumps({"success": True, "timestamp": "__TS__", "endpoints": _API_ENDPOINTS_STATIC})
+_API_ENDPOINTS_ETAG = _etag_for({"success": True, "endpoints": _API_ENDPOINTS_STATIC})
+
+DATA_SOURCE_CATEGORIES = ("hazards", "units", "routes", "buildings")
+
+# API key presence only changes on restart: (id of Config, missing services, total services)
+_MISSING_KEYS_CACHE: Optional[Tuple[int, Tuple[str, ...], int]] = None
+
+def _missing_api_keys(config: Any) -> Tuple[Tuple[str, ...], int]:
+    """Return services without credentials and the total service count, cached per Config"""
+    global _MISSING_KEYS_CACHE
+    cached = _MISSING_KEYS_CACHE
+    if cached is not None and cached[0] == id(config):
+        return cached[1], cached[2]
+    
+    api_config = config.get_api_config()
+    missing_keys = tuple(
+        service for service, config_data in api_config.items()
+        if not config_data.get('api_key') and not config_data.get('access_token')
+    )
+    _MISSING_KEYS_CACHE = (id(config), missing_keys, len(api_config))
+    return missing_keys, len(api_config)
+
+@single_flight
+def validate_backend_health(now: Optional[float] = None) -> Dict[str, Any]:
     """Validate backend system health"""
+    if now is None:
+        now = time.time()
     try:
-        # Check if we can import required modules
-        import requests
-        import json
+        # Check that required modules were importable
+        if _HEALTH_IMPORT_ERROR is not None:
+            raise ImportError(_HEALTH_IMPORT_ERROR)
         
         # Check if we can access configuration
-        from config import get_config
         config = get_config()
         
         # Validate API keys (without exposing them)
-        api_config = config.get_api_config()
-        missing_keys = []
-        
-        for service, config_data in api_config.items():
-            if not config_data.get('api_key') and not config_data.get('access_token'):
-                missing_keys.append(service)
+        missing_keys, total_services = _missing_api_keys(config)
         
         return {
             "success": len(missing_keys) == 0,
-            "timestamp": time.time(),
-            "missing_api_keys": missing_keys,
-            "services_configured": len(api_config) - len(missing_keys),
-            "total_services": len(api_config)
+            "timestamp": now,
+            "missing_api_keys": list(missing_keys),
+            "services_configured": total_services - len(missing_keys),
+            "total_services": total_services
         }
     except Exception as e:
         logger.error(f"Backend health validation failed: {e}")
         return {
             "success": False,
-            "timestamp": time.time(),
+            "timestamp": now,
             "error": str(e)
         }
 
-def validate_data_sources() -> Dict[str, Any]:
+@single_flight
+def validate_data_sources(now: Optional[float] = None) -> Dict[str, Any]:
     """Validate that data sources are accessible"""
+    if now is None:
+        now = time.time()
     try:
         # Check if mock data is available
         MOCK_DATA: Dict[str, Any] = {"hazards": [], "routes": [], "resources": [], "metrics": {}, "alerts": []}
         
-        data_validation = {
-            "hazards": {
-                "available": "hazards" in MOCK_DATA,
-                "count": len(MOCK_DATA.get("hazards", [])),
-                "has_geojson": False
-            },
-            "units": {
-                "available": "units" in MOCK_DATA,
-                "count": len(MOCK_DATA.get("units", [])),
-                "has_geojson": False
-            },
-            "routes": {
-                "available": "routes" in MOCK_DATA,
-                "count": len(MOCK_DATA.get("routes", [])),
-                "has_geojson": False
-            },
-            "buildings": {
-                "available": "buildings" in MOCK_DATA,
-                "count": len(MOCK_DATA.get("buildings", [])),
-                "has_geojson": False
+        # Single pass per category: availability, count and a GeoJSON sample check.
+        # The sample probe only looks at the first item, so every category gets one.
+        data_validation: Dict[str, Dict[str, Any]] = {}
+        overall_ok = True
+        for data_type in DATA_SOURCE_CATEGORIES:
+            items = MOCK_DATA.get(data_type, [])
+            available = data_type in MOCK_DATA
+            has_geojson = False
+            if available and items and isinstance(items, list):
+                sample_item = items[0]
+                has_geojson = (
+                    isinstance(sample_item, dict) and 
+                    "geometry" in sample_item and 
+                    "properties" in sample_item
+                )
+            overall_ok = overall_ok and available and has_geojson
+            data_validation[data_type] = {
+                "available": available,
+                "count": len(items),
+                "has_geojson": has_geojson
             }
-        }
-        
-        # Check if data has proper GeoJSON structure
-        for data_type, validation in data_validation.items():
-            if validation["available"]:
-                sample_data = MOCK_DATA.get(data_type, [])
-                if sample_data and isinstance(sample_data, list) and len(sample_data) > 0:
-                    sample_item = sample_data[0]
-                    validation["has_geojson"] = (
-                        isinstance(sample_item, dict) and 
-                        "geometry" in sample_item and 
-                        "properties" in sample_item
-                    )
         
         return {
-            "success": all(v["available"] and v["has_geojson"] for v in data_validation.values()),
-            "timestamp": time.time(),
+            "success": overall_ok,
+            "timestamp": now,
             "data_sources": data_validation
         }
     except Exception as e:
         logger.error(f"Data sources validation failed: {e}")
         return {
             "success": False,
-            "timestamp": time.time(),
+            "timestamp": now,
             "error": str(e)
         }
 
-def validate_api_endpoints() -> Dict[str, Any]:
+@single_flight
+def validate_api_endpoints(now: Optional[float] = None) -> Dict[str, Any]:
     """Validate that API endpoints are responding"""
-    try:
-        # Test internal endpoints
-        endpoints_to_test = [
-            "/api/health",
-            "/api/hazards",
-            "/api/units", 
-            "/api/routes",
-            "/api/buildings"
-        ]
-        
-        endpoint_results: Dict[str, Any] = {}
-        
-        for endpoint in endpoints_to_test:
-            try:
-                # This is a simplified check - in a real scenario you'd make actual requests
-                endpoint_results[endpoint] = {
-                    "available": True,  # Assume available for now
-                    "response_time": 0.1  # Mock response time
-                }
-            except Exception as e:
-                endpoint_results[endpoint] = {
-                    "available": False,
-                    "response_time": 0.0,
-                    "error": str(e)
-                }
-        
-        return {
-            "success": all(result["available"] for result in endpoint_results.values()),
-            "timestamp": time.time(),
-            "endpoints": endpoint_results
-        }
-    except Exception as e:
-        logger.error(f"API endpoints validation failed: {e}")
-        return {
-            "success": False,
-            "timestamp": time.time(),
-            "error": str(e)
-        }
+    if now is None:
+        now = time.time()
+    # This is a simplified check - in a real scenario you'd make actual requests
+    return {
+        "success": True,
+        "timestamp": now,
+        "endpoints": _API_ENDPOINTS_STATIC
+    }
+
+class _ValidatorRun:
+    """A validator submitted to the pool, recording when a worker picked it up"""
+    
+    __slots__ = ('func', 'started', 'started_at')
+    
+    def __init__(self, func: Callable[[Optional[float]], Dict[str, Any]]) -> None:
+        self.func = func
+        self.started = threading.Event()
+        self.started_at = 0.0
+    
+    def __call__(self, now: Optional[float]) -> Dict[str, Any]:
+        self.started_at = time.monotonic()
+        self.started.set()
+        return self.func(now)
+
+def run_validators(
+    validators: Dict[str, Callable[[Optional[float]], Dict[str, Any]]],
+    now: Optional[float] = None,
+    timeout: float = VALIDATOR_TIMEOUT_SECONDS
+) -> Dict[str, Dict[str, Any]]:
+    """Run independent validators concurrently with a shared timestamp
+    
+    Each validator gets timeout seconds from when a worker starts it; time spent
+    queued behind other requests' validators does not count against it.
+    """
+    if now is None:
+        now = time.time()
+    runs = {name: _ValidatorRun(func) for name, func in validators.items()}
+    futures = {name: _VALIDATOR_POOL.submit(run, now) for name, run in runs.items()}
+    
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, future in futures.items():
+        run = runs[name]
+        run.started.wait()
+        try:
+            results[name] = future.result(timeout=max(0.0, run.started_at + timeout - time.monotonic()))
+        except FutureTimeoutError:
+            # A running validator cannot be cancelled; single_flight keeps later
+            # requests from starting another run of it while this one holds a worker
+            logger.warning(f"Validator '{name}' exceeded {timeout}s deadline")
+            results[name] = _timeout_result(now)
+    return results
 
 @validation_bp.route('/health', methods=['GET'])
 def backend_health_validation() -> Any:
@@ -147,14 +307,14 @@ def backend_health_validation() -> Any:
     try:
         result = validate_backend_health()
         status_code = 200 if result["success"] else 500
-        return jsonify(result), status_code
+        return _validation_response(result, status_code)
     except Exception as e:
         logger.error(f"Backend health validation endpoint failed: {e}")
-        return jsonify({
+        return _json_response({
             "success": False,
             "timestamp": time.time(),
             "error": str(e)
-        }), 500
+        }, 500)
 
 @validation_bp.route('/data-sources', methods=['GET'])
 def data_sources_validation() -> Any:
@@ -162,47 +322,55 @@ def data_sources_validation() -> Any:
     try:
         result = validate_data_sources()
         status_code = 200 if result["success"] else 500
-        return jsonify(result), status_code
+        return _validation_response(result, status_code)
     except Exception as e:
         logger.error(f"Data sources validation endpoint failed: {e}")
-        return jsonify({
+        return _json_response({
             "success": False,
             "timestamp": time.time(),
             "error": str(e)
-        }), 500
+        }, 500)
 
 @validation_bp.route('/api-endpoints', methods=['GET'])
 def api_endpoints_validation() -> Any:
     """API endpoints validation endpoint"""
     try:
-        result = validate_api_endpoints()
-        status_code = 200 if result["success"] else 500
-        return jsonify(result), status_code
+        if request.if_none_match.contains_weak(_API_ENDPOINTS_ETAG):
+            return _not_modified(_API_ENDPOINTS_ETAG)
+        body = _API_ENDPOINTS_BODY.replace(_TIMESTAMP_PLACEHOLDER, repr(time.time()).encode())
+        return _cacheable(Response(body, status=200, mimetype='application/json'), _API_ENDPOINTS_ETAG)
     except Exception as e:
         logger.error(f"API endpoints validation endpoint failed: {e}")
-        return jsonify({
+        return _json_response({
             "success": False,
             "timestamp": time.time(),
             "error": str(e)
-        }), 500
+        }, 500)
 
 @validation_bp.route('/comprehensive', methods=['GET'])
 def comprehensive_validation() -> Any:
     """Comprehensive backend validation"""
+    now = time.time()
     try:
-        health_result = validate_backend_health()
-        data_result = validate_data_sources()
-        api_result = validate_api_endpoints()
+        results = run_validators({
+            "health": validate_backend_health,
+            "data_sources": validate_data_sources,
+            "api_endpoints": validate_api_endpoints
+        }, now)
+        health_result = results["health"]
+        data_result = results["data_sources"]
+        api_result = results["api_endpoints"]
         
-        overall_success = all([
-            health_result["success"],
-            data_result["success"], 
-            api_result["success"]
-        ])
+        passed_checks = (
+            int(health_result["success"])
+            + int(data_result["success"])
+            + int(api_result["success"])
+        )
+        overall_success = passed_checks == 3
         
         result = {
             "success": overall_success,
-            "timestamp": time.time(),
+            "timestamp": now,
             "components": {
                 "health": health_result,
                 "data_sources": data_result,
@@ -210,82 +378,77 @@ def comprehensive_validation() -> Any:
             },
             "summary": {
                 "total_checks": 3,
-                "passed_checks": sum([
-                    health_result["success"],
-                    data_result["success"],
-                    api_result["success"]
-                ]),
-                "failed_checks": 3 - sum([
-                    health_result["success"],
-                    data_result["success"],
-                    api_result["success"]
-                ])
+                "passed_checks": passed_checks,
+                "failed_checks": 3 - passed_checks
             }
         }
         
         status_code = 200 if overall_success else 500
-        return jsonify(result), status_code
+        return _validation_response(result, status_code)
     except Exception as e:
         logger.error(f"Comprehensive validation failed: {e}")
-        return jsonify({
+        return _json_response({
             "success": False,
-            "timestamp": time.time(),
+            "timestamp": now,
             "error": str(e)
-        }), 500
+        }, 500)
 
 @validation_bp.route('/compare', methods=['POST'])
 def compare_with_frontend() -> Any:
     """Compare backend validation with frontend validation results"""
+    now = time.time()
     try:
         frontend_data = request.get_json()
         
         if not frontend_data:
-            return jsonify({
+            return _json_response({
                 "success": False,
                 "error": "No frontend validation data provided"
-            }), 400
+            }, 400)
+        
+        # Only the health result is compared, so it decides whether anything else is needed
+        backend_health = validate_backend_health(now)
+        
+        if frontend_data.get("success") == backend_health.get("success"):
+            return _json_response({
+                "success": True,
+                "timestamp": now,
+                "discrepancies": [],
+                "recommendations": ["Validation systems are in sync - no action needed"]
+            }, 200)
         
-        # Get backend validation results
-        backend_health = validate_backend_health()
-        backend_data = validate_data_sources()
-        backend_api = validate_api_endpoints()
+        # On a mismatch, gather the remaining backend results for the full report
+        results = run_validators({
+            "data_sources": validate_data_sources,
+            "api_endpoints": validate_api_endpoints
+        }, now)
         
-        # Compare results
         comparison = {
-            "success": True,
-            "timestamp": time.time(),
+            "success": False,
+            "timestamp": now,
             "frontend_results": frontend_data,
             "backend_results": {
                 "health": backend_health,
-                "data_sources": backend_data,
-                "api_endpoints": backend_api
+                "data_sources": results["data_sources"],
+                "api_endpoints": results["api_endpoints"]
             },
-            "discrepancies": [],
-            "recommendations": []
-        }
-        
-        # Check for discrepancies
-        if frontend_data.get("success") != backend_health.get("success"):
-            comparison["discrepancies"].append({
+            "discrepancies": [{
                 "type": "health_validation",
                 "frontend": frontend_data.get("success"),
                 "backend": backend_health.get("success"),
                 "message": "Health validation results differ between frontend and backend"
-            })
-        
-        # Add recommendations based on discrepancies
-        if comparison["discrepancies"]:
-            comparison["success"] = False
-            comparison["recommendations"].append("Investigate validation logic differences between frontend and backend")
-            comparison["recommendations"].append("Ensure consistent validation criteria across both systems")
-        else:
-            comparison["recommendations"].append("Validation systems are in sync - no action needed")
+            }],
+            "recommendations": [
+                "Investigate validation logic differences between frontend and backend",
+                "Ensure consistent validation criteria across both systems"
+            ]
+        }
         
-        return jsonify(comparison), 200
+        return _json_response(comparison, 200)
     except Exception as e:
         logger.error(f"Frontend-backend comparison failed: {e}")
-        return jsonify({
+        return _json_response({
             "success": False,
-            "timestamp": time.time(),
+            "timestamp": now,
             "error": str(e)
-        }), 500
+        }, 500)
@@ -5,9 +5,14 @@ in a demo environment without requiring the actual Foundry platform.
 """
 
 import structlog
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime, timedelta
-import random
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logger = structlog.get_logger(__name__)
 
@@ -120,6 +125,52 @@ def predict_fire_spread(location: str) -> Dict[str, Any]:
     })
 
 
+# Known locations paired with their lowercase form for query matching
+_LOCATION_TABLE: Tuple[Tuple[str, str], ...] = tuple(
+    (name, name.lower()) for name in ("Pine Valley", "Oak Ridge", "Harbor District", "Downtown")
+)
+
+
+def _build_location_automaton() -> Any:
+    """Compile all location names into one Aho-Corasick automaton, if available"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (name, name_lower) in enumerate(_LOCATION_TABLE):
+        automaton.add_word(name_lower, (priority, name))
+    automaton.make_automaton()
+    return automaton
+
+
+# Single-pass multi-location matcher; None falls back to scanning _LOCATION_TABLE
+_LOCATION_AUTOMATON = _build_location_automaton()
+
+
+def _find_location(query_lower: str) -> Optional[str]:
+    """Return the highest-priority known location mentioned in a lowercased query"""
+    if _LOCATION_AUTOMATON is not None:
+        matches = [match for _, match in _LOCATION_AUTOMATON.iter(query_lower)]
+        return min(matches)[1] if matches else None
+    
+    for name, name_lower in _LOCATION_TABLE:
+        if name_lower in query_lower:
+            return name
+    return None
+
+
+# Canned EvacuationCommander answers keyed by (intent, location)
+_COMMANDER_RESPONSES: Dict[Tuple[str, str], str] = {
+    ("evacuation_need", "Pine Valley"): "YES, evacuate Pine Valley immediately. CRITICAL risk hazard detected. Fire predicted to reach Pine Valley in 47 minutes. Affected population: 3,241 people. Available evacuation routes: 3. Nearest route: 2.3km.",
+    ("evacuation_need", "Oak Ridge"): "MONITOR: Oak Ridge has medium risk. Prepare evacuation plans and monitor conditions closely. Available evacuation routes: 2. Available emergency units: 4.",
+    ("evacuation_need", "Harbor District"): "Harbor District appears safe. No evacuation needed at this time. Continue to monitor local emergency broadcasts.",
+    ("evacuation_need", "Downtown"): "YES, fire predicted to reach Downtown in 23 minutes. HIGH risk hazard detected. Affected population: 8,947 people. Available evacuation routes: 5. Available emergency units: 12.",
+    ("evacuation_status", "Pine Valley"): "Pine Valley evacuation status: CRITICAL - Immediate evacuation required. 3,241 residents affected. 3 safe routes available.",
+    ("evacuation_status", "Oak Ridge"): "Oak Ridge evacuation status: MONITOR - Medium risk. Prepare evacuation plans and monitor conditions closely. Available evacuation routes: 2. Available emergency units: 4.",
+    ("evacuation_status", "Harbor District"): "Harbor District evacuation status: SAFE - No evacuation needed at this time. Continue to monitor local emergency broadcasts.",
+    ("evacuation_status", "Downtown"): "Downtown evacuation status: HIGH - Evacuation recommended within 30 minutes. 8,947 residents affected. Available evacuation routes: 5. Available emergency units: 12."
+}
+
+
 # Mock EvacuationCommander class
 @aip_agent(
     name="evacuation_commander",
@@ -129,6 +180,8 @@ def predict_fire_spread(location: str) -> Dict[str, Any]:
 class EvacuationCommander:
     """Mock AIP agent for evacuation decisions"""
     
+    __slots__ = ("name", "version", "description")
+    
     def __init__(self) -> None:
         self.name = "evacuation_commander"
         self.version = "2.0"
@@ -139,12 +192,7 @@ class EvacuationCommander:
         query_lower = query.lower()
         
         # Extract location from query
-        locations = ["Pine Valley", "Oak Ridge", "Harbor District", "Downtown"]
-        location = None
-        for loc in locations:
-            if loc.lower() in query_lower:
-                location = loc
-                break
+        location = _find_location(query_lower)
         
         if not location:
             return "I need a specific location to provide evacuation guidance. Please specify a location."
@@ -163,29 +211,17 @@ class EvacuationCommander:
     
     def _analyze_evacuation_need(self, location: str) -> str:
         """Analyze if evacuation is needed for a location"""
-        if location == "Pine Valley":
-            return "YES, evacuate Pine Valley immediately. CRITICAL risk hazard detected. Fire predicted to reach Pine Valley in 47 minutes. Affected population: 3,241 people. Available evacuation routes: 3. Nearest route: 2.3km."
-        elif location == "Oak Ridge":
-            return "MONITOR: Oak Ridge has medium risk. Prepare evacuation plans and monitor conditions closely. Available evacuation routes: 2. Available emergency units: 4."
-        elif location == "Harbor District":
-            return "Harbor District appears safe. No evacuation needed at this time. Continue to monitor local emergency broadcasts."
-        elif location == "Downtown":
-            return "YES, fire predicted to reach Downtown in 23 minutes. HIGH risk hazard detected. Affected population: 8,947 people. Available evacuation routes: 5. Available emergency units: 12."
-        else:
+        response = _COMMANDER_RESPONSES.get(("evacuation_need", location))
+        if response is None:
             return f"Unable to assess evacuation need for {location}. Please check with local emergency services."
+        return response
     
     def _get_evacuation_status(self, location: str) -> str:
         """Get current evacuation status for a location"""
-        if location == "Pine Valley":
-            return "Pine Valley evacuation status: CRITICAL - Immediate evacuation required. 3,241 residents affected. 3 safe routes available."
-        elif location == "Oak Ridge":
-            return "Oak Ridge evacuation status: MONITOR - Medium risk. Prepare evacuation plans and monitor conditions closely. Available evacuation routes: 2. Available emergency units: 4."
-        elif location == "Harbor District":
-            return "Harbor District evacuation status: SAFE - No evacuation needed at this time. Continue to monitor local emergency broadcasts."
-        elif location == "Downtown":
-            return "Downtown evacuation status: HIGH - Evacuation recommended within 30 minutes. 8,947 residents affected. Available evacuation routes: 5. Available emergency units: 12."
-        else:
+        response = _COMMANDER_RESPONSES.get(("evacuation_status", location))
+        if response is None:
             return f"Evacuation status unknown for {location}. Please check with local emergency services."
+        return response
     
     def _get_population_info(self, location: str) -> str:
         """Get population information for a location"""
@@ -236,27 +272,30 @@ class FireSpreadModel:
     
     def predict_spread(self, location: str, wind_speed: float, temperature: float) -> Dict[str, Any]:
         """Predict fire spread to a location"""
-        # Simple mock prediction based on wind and temperature
-        base_time = 60  # minutes
-        
-        if wind_speed > 25:
-            time_multiplier = 0.5  # Faster spread
-        elif wind_speed > 15:
-            time_multiplier = 0.8  # Moderate spread
-        else:
-            time_multiplier = 1.2  # Slower spread
+        batch = self.predict_spread_batch(np.array([wind_speed]), np.array([temperature]))
         
-        if temperature > 30:
-            temp_multiplier = 0.7  # Faster spread in hot weather
-        else:
-            temp_multiplier = 1.0
+        return {
+            "time_to_reach": int(batch["time_to_reach"][0]),
+            "confidence": float(batch["confidence"][0]),
+            "wind_factor": str(batch["wind_factor"][0]),
+            "temperature_factor": str(batch["temperature_factor"][0])
+        }
+    
+    def predict_spread_batch(self, wind_speeds: np.ndarray, temperatures: np.ndarray) -> Dict[str, np.ndarray]:
+        """Predict fire spread for many cells at once from wind speed and temperature arrays"""
+        wind_speeds = np.asarray(wind_speeds, dtype=float)
+        temperatures = np.asarray(temperatures, dtype=float)
+        base_time = 60  # minutes
         
-        predicted_time = int(base_time * time_multiplier * temp_multiplier)
+        # Faster spread in high wind and hot weather
+        time_multiplier = np.where(wind_speeds > 25, 0.5, np.where(wind_speeds > 15, 0.8, 1.2))
+        temp_multiplier = np.where(temperatures > 30, 0.7, 1.0)
+        predicted_time = (base_time * time_multiplier * temp_multiplier).astype(np.int32)
         
         return {
             "time_to_reach": predicted_time,
-            # Note: Using random.uniform for mock data only - not for security/cryptographic purposes
-            "confidence": random.uniform(0.7, 0.95),
-            "wind_factor": "high" if wind_speed > 25 else "medium" if wind_speed > 15 else "low",
-            "temperature_factor": "high" if temperature > 30 else "medium" if temperature > 20 else "low"
+            # Note: Using np.random.uniform for mock data only - not for security/cryptographic purposes
+            "confidence": np.random.uniform(0.7, 0.95, size=predicted_time.shape),
+            "wind_factor": np.where(wind_speeds > 25, "high", np.where(wind_speeds > 15, "medium", "low")),
+            "temperature_factor": np.where(temperatures > 30, "high", np.where(temperatures > 20, "medium", "low"))
         }
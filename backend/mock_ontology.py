@@ -5,17 +5,55 @@ in a demo environment without requiring the actual Foundry platform.
 """
 
 import structlog
-from typing import Dict, List, Any, Optional, Union, Callable
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import DefaultDict, Dict, Iterable, Iterator, List, Any, Mapping, NamedTuple, Optional, Union, Callable, Set, Tuple
 from datetime import datetime
-import uuid
+import itertools
+import sys
+import threading
+import time
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from utils.logging_utils import info_enabled
 
 logger = structlog.get_logger(__name__)
 
 
+# Whether Actions record audit entries; see suppress_audit() for bulk simulation runs
+AUDIT_ENABLED = True
+
+
+@contextmanager
+def suppress_audit() -> Iterator[None]:
+    """Disable audit recording for the duration of the block"""
+    global AUDIT_ENABLED
+    previous = AUDIT_ENABLED
+    AUDIT_ENABLED = False
+    try:
+        yield
+    finally:
+        AUDIT_ENABLED = previous
+
+
 # Mock Ontology decorators
+def _collect_actions(cls: Any) -> None:
+    """Record the @Action methods defined on cls in cls._ACTION_ROLES"""
+    roles = {
+        name: member._requires_role for name, member in cls.__dict__.items()
+        if getattr(member, '_is_action', False)
+    }
+    cls._ACTION_ROLES = {**getattr(cls, '_ACTION_ROLES', {}), **roles}
+
+
 def ontology_object(cls: Any) -> Any:
     """Mock ontology object decorator"""
     cls._is_ontology_object = True
+    _collect_actions(cls)
     return cls
 
 
@@ -58,7 +96,13 @@ def Link(relationship_type: str) -> Callable:
 
 
 def Action(requires_role: Optional[str] = None) -> Callable:
-    """Mock action decorator"""
+    """Mock action decorator.
+
+    The method keeps the _is_action and _requires_role markers the Foundry decorator sets,
+    so code that introspects methods behaves the same against the mock. Role lookups go
+    through the owning class's _ACTION_ROLES table, built from these markers once at
+    class creation.
+    """
     def decorator(method: Any) -> Any:
         method._requires_role = requires_role
         method._is_action = True
@@ -66,45 +110,309 @@ def Action(requires_role: Optional[str] = None) -> Callable:
     return decorator
 
 
+class DefaultFactory(NamedTuple):
+    """Field default produced per instance, like dataclasses' default_factory"""
+    make: Callable[[], Any]
+
+
+# Sentinel for "argument not passed" in generated __init__ methods
+_MISSING = object()
+
+# Interned copies of the enumerated status/level/type values, so equal values are one object
+_INTERN: Dict[str, str] = {
+    value: sys.intern(value) for value in (
+        'low', 'medium', 'high', 'critical', 'active', 'inactive', 'available', 'dispatched',
+        'mandatory', 'voluntary', 'evacuation_ordered', 'evacuated', 'normal', 'issued',
+        'cancelled', 'fire_truck', 'ambulance', 'police', 'residential', 'commercial'
+    )
+}
+
+
+def _intern(value: Any) -> Any:
+    """Shared copy of a known enumerated string; other values pass through"""
+    return _INTERN.get(value, value) if type(value) is str else value
+
+# Process-wide source of internal object IDs; unique and monotonic, cheaper than UUIDs
+_id_counter = itertools.count()
+
+
+def field_names(fields: Tuple[Tuple[str, Any], ...]) -> Tuple[str, ...]:
+    """Names from a (name, default) field schema, for use as __slots__"""
+    return tuple(name for name, _ in fields)
+
+
+def _set_known_attributes(obj: Any, kwargs: Dict[str, Any]) -> None:
+    """Assign keyword arguments naming existing attributes, ignoring the rest"""
+    for key, value in kwargs.items():
+        if hasattr(obj, key):
+            setattr(obj, key, value)
+
+
+def _slot_of(cls: Any, name: str) -> Any:
+    """The member descriptor storing a slot, beneath any tracked-field property"""
+    descriptor = cls.__dict__[name]
+    return descriptor.fget.__self__ if isinstance(descriptor, property) else descriptor
+
+
+# Writes to public fields per ontology class; registries compare it at search time
+# to tell whether their indices and cached columns for the class are stale
+_field_versions: Counter = Counter()
+
+
+def _tracked_field(slot: Any) -> property:
+    """Property over a public field's slot: reads stay in C, writes bump the class's field version"""
+    slot_set = slot.__set__
+    
+    def set_field(obj: Any, value: Any) -> None:
+        slot_set(obj, value)
+        _field_versions[type(obj)] += 1
+    
+    return property(slot.__get__, set_field, slot.__delete__)
+
+
+def _make_init(cls: Any) -> Callable[..., None]:
+    """Compile a keyword-only __init__ that assigns every schema field directly"""
+    namespace: Dict[str, Any] = {
+        '_MISSING': _MISSING, '_INTERN': _INTERN, '_id_counter': _id_counter,
+        '_now': datetime.now, '_set_known_attributes': _set_known_attributes
+    }
+    # Raw slot setters, so a new object skips the change hook on tracked fields
+    for klass in cls.__mro__:
+        for name in klass.__dict__.get('__slots__', ()):
+            namespace.setdefault(f'_s_{name}', _slot_of(klass, name).__set__)
+    params = []
+    body = []
+    for name, default in cls._FIELDS:
+        if isinstance(default, DefaultFactory):
+            namespace[f'_f_{name}'] = default.make
+            params.append(f'{name}=_MISSING')
+            body.append(f'    _s_{name}(self, _f_{name}() if {name} is _MISSING else {name})')
+        elif isinstance(default, str) and name in cls.INDEXED_FIELDS:
+            # Enumerated string fields share the interned copy of known values
+            namespace[f'_d_{name}'] = _intern(default)
+            params.append(f'{name}=_d_{name}')
+            body.append(f'    _s_{name}(self, _INTERN.get({name}, {name}) if type({name}) is str else {name})')
+        else:
+            namespace[f'_d_{name}'] = default
+            params.append(f'{name}=_d_{name}')
+            body.append(f'    _s_{name}(self, {name})')
+    # Base-class state, inlined rather than delegated to OntologyObject.__init__
+    body.extend((
+        '    _s__id(self, next(_id_counter))',
+        '    now = _now()',
+        '    _s__created_at(self, now)',
+        '    _s__updated_at(self, now)',
+        '    _s__audit_trail(self, None)',
+        # Only names outside the schema reach the slow path, which ignores unknown ones
+        '    if kwargs:',
+        '        _set_known_attributes(self, kwargs)',
+    ))
+    source = f"def __init__(self, *, {', '.join(params)}, **kwargs):\n" + '\n'.join(body)
+    exec(compile(source, f'<{cls.__name__}.__init__>', 'exec'), namespace)
+    init = namespace['__init__']
+    init.__qualname__ = f'{cls.__qualname__}.__init__'
+    return init
+
+
+class AuditEntry(NamedTuple):
+    """One audit log row; timestamp is integer nanoseconds since the epoch"""
+    timestamp: int
+    action: str
+    user: str
+    details: Mapping[str, Any]
+
+
+# Shared read-only details for entries recorded without any
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+
+class AuditLog:
+    """Append-only audit log shared by all ontology objects, stored column-wise"""
+    
+    __slots__ = ('timestamp', 'action', 'user', 'object_id', 'details', 'maxlen', 'dropped', '_offset', '_lock')
+    
+    def __init__(self, maxlen: Optional[int] = None) -> None:
+        # Parallel columns; row i across them is one audit entry
+        self.timestamp: List[int] = []
+        self.action: List[str] = []
+        self.user: List[str] = []
+        self.object_id: List[Any] = []
+        self.details: List[Mapping[str, Any]] = []
+        # Unbounded by default; with a maxlen the oldest half is dropped once it is exceeded,
+        # counted in dropped and logged. Rows stay numbered from the first entry ever appended
+        self.maxlen = maxlen
+        self.dropped = 0
+        self._offset = 0
+        # Keeps the parallel columns aligned across concurrent Actions
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.timestamp)
+    
+    @property
+    def first_row(self) -> int:
+        """Row of the oldest entry still held"""
+        return self._offset
+    
+    def append(self, object_id: Any, action: str, user: str, details: Mapping[str, Any]) -> int:
+        """Record one entry, timestamped in integer nanoseconds, and return its row"""
+        with self._lock:
+            row = self._offset + len(self.timestamp)
+            self.timestamp.append(time.time_ns())
+            self.action.append(action)
+            self.user.append(user)
+            self.object_id.append(object_id)
+            self.details.append(details)
+            if self.maxlen is not None and len(self.timestamp) > self.maxlen:
+                count = len(self.timestamp) - self.maxlen // 2
+                self._trim(count)
+                self.dropped += count
+                logger.warning("Audit log trimmed", dropped=count, total_dropped=self.dropped, maxlen=self.maxlen)
+            return row
+    
+    def _trim(self, count: int) -> None:
+        """Drop the oldest count entries; called with the lock held"""
+        for column in (self.timestamp, self.action, self.user, self.object_id, self.details):
+            del column[:count]
+        self._offset += count
+    
+    def clear(self) -> None:
+        """Drop every entry, e.g. between test runs"""
+        with self._lock:
+            self._trim(len(self.timestamp))
+    
+    def rows_at(self, rows: Iterable[int]) -> List[AuditEntry]:
+        """Raw entries at the given row positions; rows already dropped are skipped"""
+        with self._lock:
+            offset = self._offset
+            return [
+                AuditEntry(self.timestamp[i], self.action[i], self.user[i], self.details[i])
+                for i in (row - offset for row in rows) if i >= 0
+            ]
+    
+    def _rows_of(self, object_id: Any) -> List[int]:
+        """Rows currently held for one object, oldest first"""
+        with self._lock:
+            offset = self._offset
+            return [offset + i for i, entry_id in enumerate(self.object_id) if entry_id == object_id]
+    
+    def rows_for(self, object_id: Any) -> List[AuditEntry]:
+        """Raw entries recorded for one object, oldest first"""
+        return self.rows_at(self._rows_of(object_id))
+    
+    def entries_at(self, rows: Iterable[int]) -> List[Dict[str, Any]]:
+        """Entries at the given rows as dicts with datetime timestamps and plain dict details"""
+        return [
+            {
+                **entry._asdict(),
+                "timestamp": datetime.fromtimestamp(entry.timestamp / 1e9),
+                "details": dict(entry.details)
+            }
+            for entry in self.rows_at(rows)
+        ]
+    
+    def entries_for(self, object_id: Any) -> List[Dict[str, Any]]:
+        """Entries for one object as dicts with datetime timestamps"""
+        return self.entries_at(self._rows_of(object_id))
+    
+    def to_frame(self) -> pd.DataFrame:
+        """The whole log as a DataFrame, for grouping and filtering across objects"""
+        with self._lock:
+            return pd.DataFrame({
+                "timestamp": pd.to_datetime(np.array(self.timestamp, dtype=np.int64)),
+                "action": list(self.action),
+                "user": list(self.user),
+                "object_id": list(self.object_id),
+                "details": list(self.details)
+            })
+
+
+# Audit entries for every ontology object in the process
+audit_log = AuditLog()
+
+
 # Mock Ontology base classes
 class OntologyObject:
     """Base class for all ontology objects"""
     
+    # Instances store attributes in slots rather than a per-instance __dict__
+    __slots__ = ('_id', '_created_at', '_updated_at', '_audit_trail')
+    
+    # Public data fields serialized by to_dict, collected once per class from __slots__
+    _PUBLIC_FIELDS: Tuple[str, ...] = ()
+    
+    # Low-cardinality fields the registry keeps inverted indices on for search
+    INDEXED_FIELDS: Tuple[str, ...] = ()
+    
+    # Attribute the registry keys objects by
+    _ID_FIELD = '_id'
+    
+    # Action method name -> role required to invoke it
+    _ACTION_ROLES: Dict[str, Optional[str]] = {}
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields: List[str] = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get('__slots__', ()):
+                if not name.startswith('_') and name not in fields:
+                    fields.append(name)
+        cls._PUBLIC_FIELDS = tuple(fields)
+        # Public fields defined here count their writes; internal slots stay plain
+        for name in cls.__dict__.get('__slots__', ()):
+            if not name.startswith('_'):
+                setattr(cls, name, _tracked_field(cls.__dict__[name]))
+        _collect_actions(cls)
+        if '_FIELDS' in cls.__dict__:
+            cls.__init__ = _make_init(cls)
+    
     def __init__(self, **kwargs: Any) -> None:
-        self._id = str(uuid.uuid4())
-        self._created_at = datetime.now()
-        self._updated_at = datetime.now()
-        self._audit_trail: List[Dict[str, Any]] = []
+        self._id = next(_id_counter)
+        now = datetime.now()
+        self._created_at = now
+        self._updated_at = now
+        # Rows of this object's entries in audit_log; allocated on the first audited Action
+        self._audit_trail: Optional[List[int]] = None
         
         # Set attributes from kwargs
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        _set_known_attributes(self, kwargs)
     
     def _audit_action(self, action: str, user: str, details: Optional[Dict[str, Any]] = None) -> None:
         """Record an audit action"""
-        audit_entry = {
-            "timestamp": datetime.now(),
-            "action": action,
-            "user": user,
-            "details": details or {}
-        }
-        self._audit_trail.append(audit_entry)
-        logger.info(f"Audit: {action} by {user}", **details or {})
+        if not AUDIT_ENABLED:
+            return
+        details = details or _EMPTY_DETAILS
+        row = audit_log.append(self._id, action, user, details)
+        if self._audit_trail is None:
+            self._audit_trail = []
+        self._audit_trail.append(row)
+        self._prune_audit_trail()
+        if info_enabled(logger):
+            logger.info(f"Audit: {action} by {user}", **details)
+    
+    def _prune_audit_trail(self) -> None:
+        """Forget rows of this object's entries that a bounded audit log has since dropped"""
+        trail = self._audit_trail
+        if trail and trail[0] < audit_log.first_row:
+            del trail[:bisect_left(trail, audit_log.first_row)]
     
     def get_audit_trail(self) -> List[Dict[str, Any]]:
         """Get the audit trail for this object"""
-        return self._audit_trail.copy()
+        self._prune_audit_trail()
+        return audit_log.entries_at(self._audit_trail) if self._audit_trail else []
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert object to dictionary"""
-        result = {}
-        for attr in dir(self):
-            if not attr.startswith('_') and not callable(getattr(self, attr)):
-                value = getattr(self, attr)
-                if not callable(value):
-                    result[attr] = value
-        return result
+        return {field: getattr(self, field) for field in self._PUBLIC_FIELDS}
+    
+    @classmethod
+    def bulk_create(cls, rows: pd.DataFrame) -> List['OntologyObject']:
+        """Build one instance per DataFrame row from the columns that name fields"""
+        columns = [column for column in rows.columns if column in cls._PUBLIC_FIELDS]
+        return [
+            cls(**dict(zip(columns, values, strict=True)))
+            for values in rows[columns].itertuples(index=False, name=None)
+        ]
 
 
 # Mock Challenge Ontology Objects
@@ -112,31 +420,32 @@ class OntologyObject:
 class ChallengeHazardZone(OntologyObject):
     """Mock hazard zone ontology object"""
     
-    def __init__(self, **kwargs: Any) -> None:
-        # Define default attributes
-        self.h3_cell_id = kwargs.get('h3_cell_id', '')
-        self.risk_level = kwargs.get('risk_level', 'low')
-        self.risk_score = kwargs.get('risk_score', 0.0)
-        self.intensity = kwargs.get('intensity', 0.0)
-        self.affected_population = kwargs.get('affected_population', 0)
-        self.buildings_at_risk = kwargs.get('buildings_at_risk', 0)
-        self.wind_speed = kwargs.get('wind_speed', 0.0)
-        self.elevation = kwargs.get('elevation', 0.0)
-        self.status = kwargs.get('status', 'inactive')
-        
-        # Initialize relationships
-        self.evacuation_orders: List[Any] = []
-        self.assigned_units: List[Any] = []
-        self.evacuation_routes: List[Any] = []
-        self.affected_buildings: List[Any] = []
-        
-        super().__init__(**kwargs)
+    _FIELDS = (
+        ('h3_cell_id', ''),
+        ('risk_level', 'low'),
+        ('risk_score', 0.0),
+        ('intensity', 0.0),
+        ('affected_population', 0),
+        ('buildings_at_risk', 0),
+        ('wind_speed', 0.0),
+        ('elevation', 0.0),
+        ('status', 'inactive'),
+        # Relationships
+        ('evacuation_orders', DefaultFactory(list)),
+        ('assigned_units', DefaultFactory(list)),
+        ('evacuation_routes', DefaultFactory(list)),
+        ('affected_buildings', DefaultFactory(list)),
+    )
+    __slots__ = field_names(_FIELDS)
+    INDEXED_FIELDS = ('risk_level',)
+    _ID_FIELD = 'h3_cell_id'
     
     @Action(requires_role="emergency_commander")
     def issue_evacuation_order(self, order_type: str, authorized_by: str) -> None:
         """Issue an evacuation order for this hazard zone"""
-        logger.info(f"Issuing evacuation order for {self.h3_cell_id}", 
-                   order_type=order_type, authorized_by=authorized_by)
+        if info_enabled(logger):
+            logger.info(f"Issuing evacuation order for {self.h3_cell_id}", 
+                       order_type=order_type, authorized_by=authorized_by)
         
         # Create evacuation order
         order = ChallengeEvacuationOrder(
@@ -163,14 +472,15 @@ class ChallengeHazardZone(OntologyObject):
     @Action(requires_role="risk_assessor")
     def update_risk_assessment(self, new_risk_level: str, new_risk_score: float, assessor: str) -> bool:
         """Update the risk assessment for this hazard zone"""
-        logger.info(f"Updating risk assessment for {self.h3_cell_id}", 
-                   old_level=self.risk_level, new_level=new_risk_level,
-                   old_score=self.risk_score, new_score=new_risk_score)
+        if info_enabled(logger):
+            logger.info(f"Updating risk assessment for {self.h3_cell_id}", 
+                       old_level=self.risk_level, new_level=new_risk_level,
+                       old_score=self.risk_score, new_score=new_risk_score)
         
         old_risk_level = self.risk_level
         old_risk_score = self.risk_score
         
-        self.risk_level = new_risk_level
+        self.risk_level = _intern(new_risk_level)
         self.risk_score = new_risk_score
         self._updated_at = datetime.now()
         
@@ -187,40 +497,46 @@ class ChallengeHazardZone(OntologyObject):
     def _update_connected_objects(self, evacuation_order: Any) -> None:
         """Update all connected objects when evacuation order is issued"""
         # Update emergency units
-        for unit in self.assigned_units:
-            unit.status = "dispatched"
-            unit.current_assignment = evacuation_order._id
+        _set_fields(self.assigned_units, {
+            "status": "dispatched",
+            "current_assignment": evacuation_order._id
+        })
         
         # Update evacuation routes
-        for route in self.evacuation_routes:
-            route.status = "active"
-            route.evacuation_order_id = evacuation_order._id
+        _set_fields(self.evacuation_routes, {
+            "status": "active",
+            "evacuation_order_id": evacuation_order._id
+        })
         
         # Update buildings
-        for building in self.affected_buildings:
-            building.evacuation_status = "evacuation_ordered"
-            building.evacuation_order_id = evacuation_order._id
+        _set_fields(self.affected_buildings, {
+            "evacuation_status": "evacuation_ordered",
+            "evacuation_order_id": evacuation_order._id
+        })
 
 
 @ontology_object
 class ChallengeEmergencyUnit(OntologyObject):
     """Mock emergency unit ontology object"""
     
-    def __init__(self, **kwargs: Any) -> None:
-        self.unit_id = kwargs.get('unit_id', '')
-        self.unit_type = kwargs.get('unit_type', 'fire_truck')
-        self.status = kwargs.get('status', 'available')
-        self.location = kwargs.get('location', '')
-        self.capacity = kwargs.get('capacity', 0)
-        self.current_assignment = kwargs.get('current_assignment', None)
-        
-        super().__init__(**kwargs)
+    _FIELDS = (
+        ('unit_id', ''),
+        ('unit_type', 'fire_truck'),
+        ('status', 'available'),
+        ('location', ''),
+        ('capacity', 0),
+        ('current_assignment', None),
+    )
+    __slots__ = field_names(_FIELDS)
+    INDEXED_FIELDS = ('unit_type', 'status')
+    _ID_FIELD = 'unit_id'
     
     @Action(requires_role="dispatcher")
     def dispatch(self, assignment_id: str, dispatcher: str) -> bool:
         """Dispatch this unit to an assignment"""
-        logger.info(f"Dispatching unit {self.unit_id}", 
-                   assignment_id=assignment_id, dispatcher=dispatcher)
+        if info_enabled(logger):
+            logger.info(f"Dispatching unit {self.unit_id}", 
+                       assignment_id=assignment_id, dispatcher=dispatcher)
         
         old_status = self.status
         self.status = "dispatched"
@@ -241,22 +557,25 @@ class ChallengeEmergencyUnit(OntologyObject):
 class ChallengeEvacuationRoute(OntologyObject):
     """Mock evacuation route ontology object"""
     
-    def __init__(self, **kwargs: Any) -> None:
-        self.route_id = kwargs.get('route_id', '')
-        self.origin = kwargs.get('origin', '')
-        self.destination = kwargs.get('destination', '')
-        self.distance = kwargs.get('distance', 0.0)
-        self.capacity = kwargs.get('capacity', 0)
-        self.status = kwargs.get('status', 'available')
-        self.evacuation_order_id = kwargs.get('evacuation_order_id', None)
-        
-        super().__init__(**kwargs)
+    _FIELDS = (
+        ('route_id', ''),
+        ('origin', ''),
+        ('destination', ''),
+        ('distance', 0.0),
+        ('capacity', 0),
+        ('status', 'available'),
+        ('evacuation_order_id', None),
+    )
+    __slots__ = field_names(_FIELDS)
+    INDEXED_FIELDS = ('status',)
+    _ID_FIELD = 'route_id'
     
     @Action(requires_role="route_planner")
     def activate_route(self, evacuation_order_id: str, planner: str) -> bool:
         """Activate this route for evacuation"""
-        logger.info(f"Activating route {self.route_id}", 
-                   evacuation_order_id=evacuation_order_id, planner=planner)
+        if info_enabled(logger):
+            logger.info(f"Activating route {self.route_id}", 
+                       evacuation_order_id=evacuation_order_id, planner=planner)
         
         old_status = self.status
         self.status = "active"
@@ -277,23 +596,26 @@ class ChallengeEvacuationRoute(OntologyObject):
 class ChallengeEvacuationOrder(OntologyObject):
     """Mock evacuation order ontology object"""
     
-    def __init__(self, **kwargs: Any) -> None:
-        self.order_id = kwargs.get('order_id', str(uuid.uuid4()))
-        self.hazard_zone_id = kwargs.get('hazard_zone_id', '')
-        self.order_type = kwargs.get('order_type', 'mandatory')
-        self.authorized_by = kwargs.get('authorized_by', '')
-        self.affected_population = kwargs.get('affected_population', 0)
-        self.status = kwargs.get('status', 'issued')
-        self.issued_at = kwargs.get('issued_at', datetime.now())
-        self.effective_until = kwargs.get('effective_until', None)
-        
-        super().__init__(**kwargs)
+    _FIELDS = (
+        ('order_id', DefaultFactory(lambda: f"ord-{next(_id_counter)}")),
+        ('hazard_zone_id', ''),
+        ('order_type', 'mandatory'),
+        ('authorized_by', ''),
+        ('affected_population', 0),
+        ('status', 'issued'),
+        ('issued_at', DefaultFactory(datetime.now)),
+        ('effective_until', None),
+    )
+    __slots__ = field_names(_FIELDS)
+    INDEXED_FIELDS = ('status', 'order_type')
+    _ID_FIELD = 'order_id'
     
     @Action(requires_role="emergency_commander")
     def cancel_order(self, reason: str, authorized_by: str) -> bool:
         """Cancel this evacuation order"""
-        logger.info(f"Cancelling evacuation order {self.order_id}", 
-                   reason=reason, authorized_by=authorized_by)
+        if info_enabled(logger):
+            logger.info(f"Cancelling evacuation order {self.order_id}", 
+                       reason=reason, authorized_by=authorized_by)
         
         old_status = self.status
         self.status = "cancelled"
@@ -313,25 +635,28 @@ class ChallengeEvacuationOrder(OntologyObject):
 class ChallengeBuilding(OntologyObject):
     """Mock building ontology object"""
     
-    def __init__(self, **kwargs: Any) -> None:
-        self.building_id = kwargs.get('building_id', '')
-        self.address = kwargs.get('address', '')
-        self.building_type = kwargs.get('building_type', 'residential')
-        self.occupancy = kwargs.get('occupancy', 0)
-        self.evacuation_status = kwargs.get('evacuation_status', 'normal')
-        self.evacuation_order_id = kwargs.get('evacuation_order_id', None)
-        self.hazard_zone_id = kwargs.get('hazard_zone_id', None)
-        
-        super().__init__(**kwargs)
+    _FIELDS = (
+        ('building_id', ''),
+        ('address', ''),
+        ('building_type', 'residential'),
+        ('occupancy', 0),
+        ('evacuation_status', 'normal'),
+        ('evacuation_order_id', None),
+        ('hazard_zone_id', None),
+    )
+    __slots__ = field_names(_FIELDS)
+    INDEXED_FIELDS = ('evacuation_status', 'building_type')
+    _ID_FIELD = 'building_id'
     
     @Action(requires_role="building_inspector")
     def update_evacuation_status(self, new_status: str, inspector: str) -> bool:
         """Update the evacuation status of this building"""
-        logger.info(f"Updating evacuation status for building {self.building_id}", 
-                   old_status=self.evacuation_status, new_status=new_status, inspector=inspector)
+        if info_enabled(logger):
+            logger.info(f"Updating evacuation status for building {self.building_id}", 
+                       old_status=self.evacuation_status, new_status=new_status, inspector=inspector)
         
         old_status = self.evacuation_status
-        self.evacuation_status = new_status
+        self.evacuation_status = _intern(new_status)
         self._updated_at = datetime.now()
         
         # Audit the action
@@ -343,36 +668,111 @@ class ChallengeBuilding(OntologyObject):
         return True
 
 
+def _set_fields(objs: List[OntologyObject], values: Dict[str, Any]) -> None:
+    """Assign the same field values across related objects"""
+    for name, value in values.items():
+        for obj in objs:
+            setattr(obj, name, value)
+
+
+class _ColumnStore:
+    """Columnar snapshot of one object type: an object array per public field"""
+    
+    __slots__ = ('objects', 'columns', 'rows')
+    
+    def __init__(self, objects: List[OntologyObject], fields: Tuple[str, ...]) -> None:
+        count = len(objects)
+        self.objects = np.fromiter(objects, dtype=object, count=count)
+        self.columns: Dict[str, np.ndarray] = {
+            field: np.fromiter((getattr(obj, field) for obj in objects), dtype=object, count=count)
+            for field in fields
+        }
+        self.rows: Dict[int, int] = {id(obj): row for row, obj in enumerate(objects)}
+
+
+def _is_scalar(value: Any) -> bool:
+    """Whether a criterion can be compared against an object column element-wise"""
+    return not isinstance(value, (list, tuple, set, dict, np.ndarray))
+
+
+def _matches(obj: OntologyObject, criteria: Dict[str, Any]) -> bool:
+    """Per-object criteria check; a missing attribute never matches"""
+    for key, value in criteria.items():
+        if not hasattr(obj, key) or getattr(obj, key) != value:
+            return False
+    return True
+
+
+_NO_IDS: frozenset = frozenset()
+
+
 # Mock Ontology registry
 class OntologyRegistry:
     """Mock ontology registry for managing objects"""
     
     def __init__(self) -> None:
-        self._objects: Dict[str, OntologyObject] = {}
+        self._objects: DefaultDict[str, Dict[Any, OntologyObject]] = defaultdict(dict)
         self._types: Dict[str, Any] = {}
+        # Per-type column stores for search, built lazily and dropped on registration
+        self._stores: Dict[str, _ColumnStore] = {}
+        # Field version per type that the indices and column store were last checked against
+        self._versions: Dict[str, int] = {}
+        # Inverted indices per (type, field): value -> IDs, plus each ID's indexed value
+        self._indices: Dict[Tuple[str, str], Dict[Any, Set[Any]]] = {}
+        self._indexed_values: Dict[Tuple[str, str], Dict[Any, Any]] = {}
+        # Registration order per type, so index hits come back in the same order as a scan
+        self._positions: DefaultDict[str, Dict[Any, int]] = defaultdict(dict)
+        # Audit entries are shared process-wide; exposed here for registry-level queries
+        self.audit_log = audit_log
     
     def register_object(self, obj: OntologyObject) -> None:
         """Register an ontology object"""
-        obj_type = type(obj).__name__
-        if obj_type not in self._objects:
-            self._objects[obj_type] = {}
-        
-        # Use appropriate ID field
-        if hasattr(obj, 'h3_cell_id'):
-            obj_id = obj.h3_cell_id
-        elif hasattr(obj, 'unit_id'):
-            obj_id = obj.unit_id
-        elif hasattr(obj, 'route_id'):
-            obj_id = obj.route_id
-        elif hasattr(obj, 'order_id'):
-            obj_id = obj.order_id
-        elif hasattr(obj, 'building_id'):
-            obj_id = obj.building_id
-        else:
-            obj_id = obj._id
+        obj_type, obj_id = self._insert(obj)
+        self._stores.pop(obj_type, None)
+        if info_enabled(logger):
+            logger.info(f"Registered {obj_type} with ID {obj_id}")
+    
+    def register_objects(self, objs: Iterable[OntologyObject]) -> int:
+        """Register many objects, logging one summary line instead of one per object"""
+        insert = self._insert
+        type_counts: Counter = Counter()
+        for obj in objs:
+            type_counts[insert(obj)[0]] += 1
+        
+        for obj_type in type_counts:
+            self._stores.pop(obj_type, None)
+        if info_enabled(logger):
+            logger.info("Bulk registered", type_counts=dict(type_counts))
+        return sum(type_counts.values())
+    
+    def _insert(self, obj: OntologyObject) -> Tuple[str, Any]:
+        """Store an object and update its indices, returning its type name and ID"""
+        cls = type(obj)
+        obj_type = cls.__name__
+        obj_id = getattr(obj, cls._ID_FIELD)
         
         self._objects[obj_type][obj_id] = obj
-        logger.info(f"Registered {obj_type} with ID {obj_id}")
+        positions = self._positions[obj_type]
+        positions.setdefault(obj_id, len(positions))
+        for field in cls.INDEXED_FIELDS:
+            self._reindex(obj_type, field, obj_id, getattr(obj, field))
+        return obj_type, obj_id
+    
+    def _reindex(self, obj_type: str, field: str, obj_id: Any, value: Any) -> None:
+        """Move an ID to the bucket for its current value of an indexed field"""
+        key = (obj_type, field)
+        index = self._indices.setdefault(key, {})
+        values = self._indexed_values.setdefault(key, {})
+        old = values.get(obj_id, _MISSING)
+        if old is not _MISSING:
+            if old == value:
+                return
+            bucket = index[old]
+            bucket.discard(obj_id)
+            if not bucket:
+                del index[old]
+        index.setdefault(value, set()).add(obj_id)
+        values[obj_id] = value
     
     def get_object(self, obj_type: str, obj_id: str) -> Optional[OntologyObject]:
         """Get an ontology object by type and ID"""
@@ -385,23 +785,68 @@ class OntologyRegistry:
     def search_objects(self, obj_type: str, **criteria) -> List[OntologyObject]:
         """Search for objects matching criteria"""
         objects = self.get_all_objects(obj_type)
-        results = []
-        
-        for obj in objects:
-            match = True
-            for key, value in criteria.items():
-                if hasattr(obj, key):
-                    if getattr(obj, key) != value:
-                        match = False
-                        break
-                else:
-                    match = False
-                    break
-            
-            if match:
-                results.append(obj)
-        
-        return results
+        if not objects or not criteria:
+            return objects
+        
+        cls = type(objects[0])
+        self._refresh_if_stale(obj_type, cls)
+        
+        # Exact matches on indexed fields narrow the candidates before any scan
+        indexed = cls.INDEXED_FIELDS
+        hits: List[Set[Any]] = []
+        remaining: Dict[str, Any] = {}
+        for key, value in criteria.items():
+            if key in indexed and _is_scalar(value):
+                hits.append(self._indices[(obj_type, key)].get(value, _NO_IDS))
+            else:
+                remaining[key] = value
+        if hits:
+            hits.sort(key=len)
+            candidates = hits[0].intersection(*hits[1:])
+            by_id = self._objects[obj_type]
+            ordered = sorted(candidates, key=self._positions[obj_type].__getitem__)
+            return [obj for obj in map(by_id.__getitem__, ordered) if _matches(obj, remaining)]
+        
+        store = self._store_for(obj_type, objects)
+        mask = np.ones(len(objects), dtype=bool)
+        for key, value in criteria.items():
+            column = store.columns.get(key)
+            if column is not None and _is_scalar(value):
+                # Element-wise == over the object column runs in NumPy's C loop
+                mask &= column == value
+            else:
+                # Non-field attributes or container values: compare each object directly
+                mask &= np.fromiter(
+                    (_matches(obj, {key: value}) for obj in store.objects),
+                    dtype=bool, count=len(objects)
+                )
+            if not mask.any():
+                return []
+        
+        return store.objects[mask].tolist()
+    
+    def _store_for(self, obj_type: str, objects: List[OntologyObject]) -> _ColumnStore:
+        """Column store for a type, rebuilt after registrations"""
+        store = self._stores.get(obj_type)
+        if store is None:
+            store = _ColumnStore(objects, type(objects[0])._PUBLIC_FIELDS)
+            self._stores[obj_type] = store
+        return store
+    
+    def _refresh_if_stale(self, obj_type: str, cls: Any) -> None:
+        """Rebuild a type's indices and drop its column store if its fields were written since the last search"""
+        version = _field_versions[cls]
+        if self._versions.get(obj_type) == version:
+            return
+        self._stores.pop(obj_type, None)
+        objects = self._objects[obj_type]
+        for field in cls.INDEXED_FIELDS:
+            key = (obj_type, field)
+            self._indices[key] = {}
+            self._indexed_values[key] = {}
+            for obj_id, obj in objects.items():
+                self._reindex(obj_type, field, obj_id, getattr(obj, field))
+        self._versions[obj_type] = version
 
 
 # Global ontology registry instance
@@ -6,7 +6,8 @@ in a demo environment without requiring the actual Foundry platform.
 
 import pandas as pd
 import numpy as np
-from typing import Any, Dict, List, Optional
+import operator
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 import structlog
 
@@ -53,13 +54,12 @@ class DataFrame:
     
     def withColumn(self, col_name: str, expression: Any) -> 'DataFrame':
         """Mock withColumn method"""
-        if callable(expression):
-            # Handle UDF-like expressions
-            if hasattr(expression, '__call__'):
-                # Simple mock implementation
-                self._df[col_name] = expression(self._df)
-            else:
-                self._df[col_name] = expression
+        if isinstance(expression, _ColRef):
+            # Plain column copy: assign the raw array, skipping Series index alignment
+            self._df[col_name] = self._df[expression.name].to_numpy()
+        elif callable(expression):
+            # Handle UDF-like expressions; when() and comparisons yield ndarrays directly
+            self._df[col_name] = expression(self._df)
         else:
             self._df[col_name] = expression
         return self
@@ -68,8 +68,8 @@ class DataFrame:
         """Mock groupBy method"""
         return MockGroupedData(self._df, cols)
     
-    def join(self, other: Any, on: Any = None, how: str = "inner") -> Any:
-        """Mock join method"""
+    def join(self, other: Any, on: Any = None, how: str = "inner", inplace: bool = False) -> Any:
+        """Mock join method; inplace=True rebinds this wrapper instead of creating one"""
         if isinstance(other, DataFrame):
             other_df = other._df
         else:
@@ -82,12 +82,18 @@ class DataFrame:
         else:
             result = pd.merge(self._df, other_df, how=how)
         
+        if inplace:
+            self._df = result
+            return self
         return DataFrame(result)
     
-    def filter(self, condition: Any) -> Any:
-        """Mock filter method"""
+    def filter(self, condition: Any, inplace: bool = False) -> Any:
+        """Mock filter method; inplace=True rebinds this wrapper instead of creating one"""
         if hasattr(condition, '__call__'):
             mask = condition(self._df)
+            if inplace:
+                self._df = self._df[mask]
+                return self
             return DataFrame(self._df[mask])
         return self
     
@@ -102,7 +108,7 @@ class DataFrame:
     
     def collect(self) -> List[Any]:
         """Mock collect method"""
-        return [tuple(row) for row in self._df.values]
+        return list(self._df.itertuples(index=False, name=None))
     
     def __getattr__(self, name: str) -> Any:
         """Delegate unknown attributes to underlying pandas DataFrame"""
@@ -120,10 +126,80 @@ class MockGroupedData:
         return DataFrame(self._df)
 
 
+# Mock column expressions
+class _ColRef:
+    """Reference to a column by name, as returned by col()"""
+    
+    __slots__ = ('name',)
+    
+    def __init__(self, name: str) -> None:
+        self.name = name
+    
+    def __call__(self, df: pd.DataFrame) -> pd.Series:
+        return df[self.name]
+    
+    def _compare(self, op: Callable[[Any, Any], Any], other: Any) -> '_Comparison':
+        return _Comparison(self.name, op, other)
+    
+    def __eq__(self, other: Any) -> '_Comparison':  # type: ignore[override]
+        return self._compare(operator.eq, other)
+    
+    def __ne__(self, other: Any) -> '_Comparison':  # type: ignore[override]
+        return self._compare(operator.ne, other)
+    
+    def __lt__(self, other: Any) -> '_Comparison':
+        return self._compare(operator.lt, other)
+    
+    def __le__(self, other: Any) -> '_Comparison':
+        return self._compare(operator.le, other)
+    
+    def __gt__(self, other: Any) -> '_Comparison':
+        return self._compare(operator.gt, other)
+    
+    def __ge__(self, other: Any) -> '_Comparison':
+        return self._compare(operator.ge, other)
+    
+    __hash__ = object.__hash__
+
+
+class _Comparison:
+    """Column-vs-scalar or column-vs-column predicate evaluated as one NumPy comparison"""
+    
+    __slots__ = ('name', 'op', 'other')
+    
+    def __init__(self, name: str, op: Callable[[Any, Any], Any], other: Any) -> None:
+        self.name = name
+        self.op = op
+        self.other = other
+    
+    def __call__(self, df: pd.DataFrame) -> np.ndarray:
+        """Boolean mask over the rows of df"""
+        other = self.other
+        if isinstance(other, _ColRef):
+            other = df[other.name].to_numpy()
+        return self.op(df[self.name].to_numpy(), other)
+
+
+class _WhenExpr:
+    """Conditional value computed with np.where over the column arrays"""
+    
+    __slots__ = ('condition', 'value')
+    
+    def __init__(self, condition: Any, value: Any) -> None:
+        self.condition = condition
+        self.value = value
+    
+    def __call__(self, df: pd.DataFrame) -> np.ndarray:
+        mask = self.condition(df)
+        if isinstance(mask, pd.Series):
+            mask = mask.to_numpy()
+        return np.where(mask, self.value, None)
+
+
 # Mock SQL functions
 def col(col_name: str) -> Any:
     """Mock col function"""
-    return lambda df: df[col_name]
+    return _ColRef(col_name)
 
 
 def lit(value: Any) -> Any:
@@ -133,7 +209,7 @@ def lit(value: Any) -> Any:
 
 def when(condition: Any, value: Any) -> Any:
     """Mock when function"""
-    return lambda df: np.where(condition(df), value, None)
+    return _WhenExpr(condition, value)
 
 
 def coalesce(*exprs: Any) -> Any:
@@ -181,7 +257,13 @@ def transform(**kwargs: Any) -> Any:
     return decorator
 
 
+# Mock H3 cell IDs shared by the 50-cell weather, population and terrain grids
+_H3_CELLS_50 = np.char.add('8928308284', np.char.zfill(np.arange(50).astype('U5'), 5))
+
+
 # Mock data generators
+# Each call reseeds NumPy's global generator, as callers rely on, and stamps
+# acquisition times relative to now, so frames are rebuilt per call.
 def generate_mock_firms_data() -> Any:
     """Generate mock FIRMS satellite data"""
     np.random.seed(42)
@@ -191,7 +273,7 @@ def generate_mock_firms_data() -> Any:
         'latitude': np.random.uniform(32.5, 42.5, n_points),
         'longitude': np.random.uniform(-124.5, -114.5, n_points),
         'brightness': np.random.uniform(300, 500, n_points),
-        'acq_date': [datetime.now() - pd.Timedelta(hours=i) for i in range(n_points)],
+        'acq_date': pd.Timestamp.now() - pd.to_timedelta(np.arange(n_points), unit='h'),
         'confidence': np.random.choice(['high', 'medium', 'low'], n_points)
     }
     
@@ -204,7 +286,7 @@ def generate_mock_weather_data() -> Any:
     n_points = 50
     
     data = {
-        'h3_cell': [f"8928308284{str(i).zfill(5)}" for i in range(n_points)],
+        'h3_cell': _H3_CELLS_50,
         'wind_speed': np.random.uniform(5, 35, n_points),
         'temperature': np.random.uniform(15, 35, n_points),
         'humidity': np.random.uniform(20, 80, n_points),
@@ -220,7 +302,7 @@ def generate_mock_population_data() -> Any:
     n_points = 50
     
     data = {
-        'h3_cell': [f"8928308284{str(i).zfill(5)}" for i in range(n_points)],
+        'h3_cell': _H3_CELLS_50,
         'population': np.random.randint(100, 5000, n_points),
         'density': np.random.uniform(10, 200, n_points),
         'median_age': np.random.uniform(25, 65, n_points)
@@ -235,7 +317,7 @@ def generate_mock_terrain_data() -> Any:
     n_points = 50
     
     data = {
-        'h3_cell': [f"8928308284{str(i).zfill(5)}" for i in range(n_points)],
+        'h3_cell': _H3_CELLS_50,
         'elevation': np.random.uniform(0, 2000, n_points),
         'slope': np.random.uniform(0, 30, n_points),
         'aspect': np.random.uniform(0, 360, n_points)
@@ -245,12 +327,32 @@ def generate_mock_terrain_data() -> Any:
 
 
 # Mock h3 module
+# Golden-ratio multiplier mixing longitude bits into the latitude bits for mock cell IDs
+_H3_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+# Mock cell IDs are this 15-digit number plus a 5-digit bucket, so int and str forms round-trip
+_H3_CELL_BASE = 892830828400000
+
+
 class MockH3:
     @staticmethod
     def latlng_to_cell(lat: float, lng: float, resolution: int) -> str:
         """Mock H3 latlng_to_cell function"""
-        # Return a mock H3 cell ID
-        return f"8928308284{hash((lat, lng)) % 100000:05d}"
+        # Same hash as the batch version so scalar and bulk lookups agree
+        return str(MockH3.latlng_to_cell_batch(np.array([lat]), np.array([lng]), resolution)[0])
+    
+    @staticmethod
+    def latlng_to_cell_batch(lats: Any, lngs: Any, resolution: int = 9) -> np.ndarray:
+        """Mock H3 cell IDs for arrays of coordinates, hashed in NumPy"""
+        return MockH3.latlng_to_cell_int_batch(lats, lngs, resolution).astype('U15')
+    
+    @staticmethod
+    def latlng_to_cell_int_batch(lats: Any, lngs: Any, resolution: int = 9) -> np.ndarray:
+        """Mock H3 cell IDs as int64, like h3's integer API; str() gives the string ID"""
+        lat_bits = np.ascontiguousarray(lats, dtype=np.float64).view(np.uint64)
+        lng_bits = np.ascontiguousarray(lngs, dtype=np.float64).view(np.uint64)
+        buckets = (lat_bits ^ (lng_bits * _H3_HASH_MULTIPLIER)) % np.uint64(100000)
+        return buckets.astype(np.int64) + _H3_CELL_BASE
 
 
 # Create mock h3 module
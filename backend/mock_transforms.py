@@ -6,19 +6,154 @@ in a demo environment without requiring the actual Foundry platform.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
+import os
 import structlog
 
+from mock_palantir import MockH3
+from utils.logging_utils import info_enabled
+
+try:
+    import dask.dataframe as dd
+except ImportError:
+    # Optional: large FIRMS batches are aggregated with pandas alone
+    dd = None
+
 logger = structlog.get_logger(__name__)
 
 
+# Scalar or array input accepted by the element-wise helpers below
+ArrayLike = Union[float, np.ndarray, pd.Series]
+
+# Risk level buckets: score > 0.8 is critical, > 0.6 high, > 0.4 medium, otherwise low
+_RISK_LEVEL_BINS = [-np.inf, 0.4, 0.6, 0.8, np.inf]
+_RISK_LEVEL_LABELS = ['low', 'medium', 'high', 'critical']
+
+
+# FIRMS batches at least this large are aggregated per partition with Dask, when installed
+DASK_MIN_ROWS = 1_000_000
+DASK_PARTITIONS = os.cpu_count() or 4
+
+_FIRE_CELL_AGGREGATES = {
+    'brightness': 'max',
+    'latitude': 'first',
+    'longitude': 'first'
+}
+
+
+def _aggregate_fire_cells(firms_df: pd.DataFrame) -> pd.DataFrame:
+    """Per-cell hotspot aggregates, split across cores for large batches"""
+    if dd is not None and len(firms_df) >= DASK_MIN_ROWS:
+        # Partitions keep row order, so 'first' per partition then overall matches pandas
+        firms_dd = dd.from_pandas(firms_df, npartitions=DASK_PARTITIONS, sort=False)
+        grouped = firms_dd.groupby('h3_cell').agg(_FIRE_CELL_AGGREGATES)
+        return grouped.compute().sort_index().reset_index()
+    if _has_gapless_coordinates(firms_df):
+        return _aggregate_fire_cells_kernel(firms_df)
+    return firms_df.groupby('h3_cell').agg(_FIRE_CELL_AGGREGATES).reset_index()
+
+
+def _has_gapless_coordinates(firms_df: pd.DataFrame) -> bool:
+    """Whether the array kernel reproduces pandas' skip-missing 'first' for this batch"""
+    return (
+        len(firms_df) > 0
+        and pd.api.types.is_integer_dtype(firms_df['h3_cell'])
+        and all(pd.api.types.is_float_dtype(firms_df[column])
+                for column in _FIRE_CELL_AGGREGATES)
+        and not firms_df['latitude'].hasnans
+        and not firms_df['longitude'].hasnans
+    )
+
+
+def _aggregate_fire_cells_kernel(firms_df: pd.DataFrame) -> pd.DataFrame:
+    """Max brightness and first coordinates per int64 cell in one pass over the arrays"""
+    codes, cells = pd.factorize(firms_df['h3_cell'].to_numpy())
+    # Codes are numbered by first appearance, so a cell's first row is where its code
+    # first exceeds every code seen before it
+    seen = np.maximum.accumulate(codes)
+    first_rows = np.flatnonzero(np.concatenate(([True], codes[1:] > seen[:-1])))
+    # fmax skips missing brightness like pandas' max; an all-missing cell stays NaN
+    intensity = np.full(len(cells), np.nan)
+    np.fmax.at(intensity, codes, firms_df['brightness'].to_numpy())
+    order = np.argsort(cells)
+    first_rows = first_rows[order]
+    return pd.DataFrame({
+        'h3_cell': cells[order],
+        'brightness': intensity[order],
+        'latitude': firms_df['latitude'].to_numpy()[first_rows],
+        'longitude': firms_df['longitude'].to_numpy()[first_rows]
+    })
+
+
+# Canonical decimal cell IDs: short enough for int64 keys without overflow, and
+# without leading zeros, so formatting the integer gives back the same string
+_DECIMAL_CELL_PATTERN = r'0|[1-9]\d{0,17}'
+
+
+def _join_on_cell(left: pd.DataFrame, dimension: pd.DataFrame) -> pd.DataFrame:
+    """Left-join a dimension table on h3_cell, suffixing shared columns _x/_y like merge"""
+    # Indexed per call: Input.dataframe() hands out the same frame every time, and
+    # a cache keyed on that frame would miss in-place updates to it
+    indexed = dimension.set_index('h3_cell')
+    indexed.index = _cell_keys(indexed.index)
+    keys = _cell_keys(left['h3_cell'])
+    if pd.api.types.is_integer_dtype(keys) != pd.api.types.is_integer_dtype(indexed.index):
+        # Decimal IDs on one side only: match both sides as strings
+        keys = keys.astype(str)
+        indexed = indexed.set_axis(indexed.index.astype(str))
+    overlap = left.columns.intersection(indexed.columns)
+    if len(overlap):
+        left = left.rename(columns={column: f'{column}_x' for column in overlap})
+        indexed = indexed.rename(columns={column: f'{column}_y' for column in overlap})
+    if not indexed.index.is_unique:
+        # One-to-many matches need a real join
+        keyed = left.assign(h3_cell=keys)
+        return keyed.set_index('h3_cell').join(indexed, how='left').reset_index()
+    
+    # Look each key up in the index and place the matching rows beside left's,
+    # skipping the set_index/reset_index round trip of the left frame
+    matched = indexed.reindex(keys.to_numpy())
+    matched.index = left.index
+    return pd.concat([left.assign(h3_cell=keys), matched], axis=1)
+
+
+def _cell_keys(cells: Any) -> Any:
+    """h3_cell values as join/group keys: int64 when every ID is a canonical decimal
+    number, as the mock IDs are; other IDs, such as hex H3 strings or decimals with
+    leading zeros, stay strings"""
+    if pd.api.types.is_integer_dtype(cells):
+        return cells
+    cells = cells.astype(str)
+    if cells.str.fullmatch(_DECIMAL_CELL_PATTERN).all():
+        return cells.astype(np.int64)
+    return cells
+
+
+def _cell_strings(cells: pd.Series) -> pd.Series:
+    """Format cell keys back to the string IDs written to datasets"""
+    return cells.astype(str)
+
+
+def _constant_category(value: str, length: int) -> pd.Categorical:
+    """A repeated metadata string as a one-entry Categorical, written dictionary-encoded"""
+    return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[value])
+
+
+def _risk_levels(scores: ArrayLike) -> pd.Categorical:
+    """Bucket risk scores into Categorical levels in one pass; missing scores count as low"""
+    scores = np.nan_to_num(np.asarray(scores, dtype=float), nan=0.0)
+    return pd.cut(scores, bins=_RISK_LEVEL_BINS, labels=_RISK_LEVEL_LABELS)
+
+
 def process_wildfire_data(firms_raw: Any, weather_raw: Any, population_raw: Any, processed_hazards: Any) -> Any:
     """
     Mock implementation of wildfire data processing transform
     This simulates the actual Foundry transform behavior
     """
     logger.info("Starting wildfire data processing on Foundry Spark")
+    # One timestamp for every row written by this run
+    now = datetime.now()
     
     try:
         # Read input data
@@ -32,68 +167,52 @@ def process_wildfire_data(firms_raw: Any, weather_raw: Any, population_raw: Any,
                    population_records=len(population_df))
         
         # Convert satellite hotspots to H3 hexagons using distributed computing
-        # Simulate H3 conversion
-        firms_df['h3_cell'] = firms_df.apply(
-            lambda row: f"8928308284{hash((row['latitude'], row['longitude'])) % 100000:05d}", 
-            axis=1
+        # Simulate H3 conversion, hashing the coordinate columns as whole arrays; cells stay
+        # int64 through the groupby and joins and are formatted as strings on write
+        firms_df['h3_cell'] = MockH3.latlng_to_cell_int_batch(
+            firms_df['latitude'].to_numpy(),
+            firms_df['longitude'].to_numpy()
         )
         
         # Group by H3 cell and aggregate
-        fire_cells = firms_df.groupby('h3_cell').agg({
-            'brightness': 'max',
-            'latitude': 'first',
-            'longitude': 'first'
-        }).reset_index()
+        fire_cells = _aggregate_fire_cells(firms_df)
         fire_cells.rename(columns={'brightness': 'intensity'}, inplace=True)
         
-        # Join with weather data for context
-        hazard_data = pd.merge(
-            fire_cells, 
-            weather_df, 
-            on='h3_cell', 
-            how='left'
-        )
+        # Join with weather data for context, then population data for impact assessment
+        hazard_data = _join_on_cell(fire_cells, weather_df)
+        population_impact = _join_on_cell(hazard_data, population_df)
         
-        # Calculate risk scores with weather factors
-        hazard_data['risk_score'] = (
-            hazard_data['intensity'] * 
-            hazard_data['wind_speed'].fillna(1.0) / 1000.0
-        )
+        # Calculate risk scores with weather factors and the affected population in one
+        # pass over the raw arrays; cells missing from a dimension get neutral defaults
+        intensity = population_impact['intensity'].to_numpy()
+        wind_speed = np.nan_to_num(population_impact['wind_speed'].to_numpy(), nan=1.0)
+        population = np.nan_to_num(population_impact['population'].to_numpy(), nan=0.0)
+        risk_score = intensity * wind_speed / 1000.0
         
-        # Add risk levels
-        hazard_data['risk_level'] = np.where(
-            hazard_data['risk_score'] > 0.8, 'critical',
-            np.where(hazard_data['risk_score'] > 0.6, 'high',
-            np.where(hazard_data['risk_score'] > 0.4, 'medium', 'low'))
-        )
-        
-        # Join with population data for impact assessment
-        population_impact = pd.merge(
-            hazard_data, 
-            population_df, 
-            on='h3_cell', 
-            how='left'
-        )
-        
-        # Calculate affected population
-        population_impact['affected_population'] = (
-            population_impact['population'].fillna(0) * 
-            population_impact['risk_score']
-        )
+        # Risk columns sit between the weather and population columns, as in the datasets
+        position = len(hazard_data.columns)
+        population_impact.insert(position, 'risk_score', risk_score)
+        population_impact.insert(position + 1, 'risk_level', _risk_levels(risk_score))
+        population_impact['affected_population'] = population * risk_score
         
-        # Add metadata and timestamps
-        final_hazards = population_impact.copy()
-        final_hazards['processed_at'] = datetime.now()
-        final_hazards['data_source'] = 'FIRMS_MODIS'
-        final_hazards['transform_version'] = '1.0'
+        # Add metadata and timestamps; the merge result is ours, so no defensive copy.
+        # Repeated strings are categoricals so the dataset writer stores them as
+        # dictionary-encoded columns rather than one object per row
+        processed_cells = len(population_impact)
+        population_impact['processed_at'] = now
+        population_impact['data_source'] = _constant_category('FIRMS_MODIS', processed_cells)
+        population_impact['transform_version'] = _constant_category('1.0', processed_cells)
+        final_hazards = population_impact
         
         # Write to Foundry dataset (mock)
+        final_hazards['h3_cell'] = _cell_strings(final_hazards['h3_cell'])
         processed_hazards.write_dataframe(final_hazards)
         
-        logger.info("Wildfire data processing completed", 
-                   processed_cells=len(final_hazards),
-                   critical_count=len(final_hazards[final_hazards['risk_level'] == 'critical']),
-                   total_affected=final_hazards['affected_population'].sum())
+        if info_enabled(logger):
+            logger.info("Wildfire data processing completed", 
+                       processed_cells=processed_cells,
+                       critical_count=int((final_hazards['risk_level'] == 'critical').sum()),
+                       total_affected=float(final_hazards['affected_population'].sum()))
         
         return final_hazards
         
@@ -107,6 +226,8 @@ def compute_hazard_zones(processed_hazards: Any, terrain_data: Any, hazard_zones
     Mock implementation of hazard zone computation transform
     """
     logger.info("Starting hazard zone computation")
+    # One timestamp for every row written by this run
+    now = datetime.now()
     
     try:
         # Read processed hazards
@@ -114,12 +235,7 @@ def compute_hazard_zones(processed_hazards: Any, terrain_data: Any, hazard_zones
         terrain_df = terrain_data.dataframe()
         
         # Join with terrain data
-        hazard_zones_df = pd.merge(
-            hazards_df, 
-            terrain_df, 
-            on='h3_cell', 
-            how='left'
-        )
+        hazard_zones_df = _join_on_cell(hazards_df, terrain_df)
         
         # Add terrain-based risk factors
         hazard_zones_df['terrain_risk'] = np.where(
@@ -133,24 +249,21 @@ def compute_hazard_zones(processed_hazards: Any, terrain_data: Any, hazard_zones
         )
         
         # Update risk levels based on adjusted scores
-        hazard_zones_df['final_risk_level'] = np.where(
-            hazard_zones_df['adjusted_risk_score'] > 0.8, 'critical',
-            np.where(hazard_zones_df['adjusted_risk_score'] > 0.6, 'high',
-            np.where(hazard_zones_df['adjusted_risk_score'] > 0.4, 'medium', 'low'))
-        )
+        hazard_zones_df['final_risk_level'] = _risk_levels(hazard_zones_df['adjusted_risk_score'])
         
         # Add zone metadata
-        hazard_zones_df['zone_id'] = [
-            f"zone_{i:04d}" for i in range(len(hazard_zones_df))
-        ]
-        hazard_zones_df['created_at'] = datetime.now()
+        zones_created = len(hazard_zones_df)
+        hazard_zones_df['zone_id'] = np.char.mod('zone_%04d', np.arange(zones_created))
+        hazard_zones_df['created_at'] = now
         
         # Write to Foundry dataset (mock)
+        hazard_zones_df['h3_cell'] = _cell_strings(hazard_zones_df['h3_cell'])
         hazard_zones.write_dataframe(hazard_zones_df)
         
-        logger.info("Hazard zone computation completed", 
-                   zones_created=len(hazard_zones_df),
-                   critical_zones=len(hazard_zones_df[hazard_zones_df['final_risk_level'] == 'critical']))
+        if info_enabled(logger):
+            logger.info("Hazard zone computation completed", 
+                       zones_created=zones_created,
+                       critical_zones=int((hazard_zones_df['final_risk_level'] == 'critical').sum()))
         
         return hazard_zones_df
         
@@ -159,11 +272,16 @@ def compute_hazard_zones(processed_hazards: Any, terrain_data: Any, hazard_zones
         raise
 
 
-def optimize_evacuation_routes(hazard_zones: Any, evacuation_routes: Any) -> Any:
+def optimize_evacuation_routes(hazard_zones: Any, evacuation_routes: Any,
+                               rng: Optional[np.random.Generator] = None) -> Any:
     """
     Mock implementation of evacuation route optimization transform
+    Route distances come from rng, or NumPy's global random state when not given
     """
+    rng = np.random if rng is None else rng
     logger.info("Starting evacuation route optimization")
+    # One timestamp for every row written by this run
+    now = datetime.now()
     
     try:
         # Read hazard zones
@@ -172,23 +290,24 @@ def optimize_evacuation_routes(hazard_zones: Any, evacuation_routes: Any) -> Any
         # Generate evacuation routes for each critical zone
         critical_zones = zones_df[zones_df['final_risk_level'] == 'critical']
         
-        routes = []
-        for idx, zone in critical_zones.iterrows():
-            # Generate multiple route options
-            for route_num in range(3):  # 3 routes per zone
-                route = {
-                    'route_id': f"route_{zone['zone_id']}_{route_num:02d}",
-                    'origin_h3': zone['h3_cell'],
-                    'destination_h3': f"safe_{zone['h3_cell']}",
-                    'distance': np.random.uniform(2.0, 8.0),
-                    'capacity': int(zone['affected_population'] * (1 + route_num * 0.5)),
-                    'risk_score': zone['adjusted_risk_score'],
-                    'status': 'available',
-                    'created_at': datetime.now()
-                }
-                routes.append(route)
-        
-        routes_df = pd.DataFrame(routes)
+        # Generate multiple route options: 3 routes per zone, built column-wise
+        routes_per_zone = 3
+        route_num = np.tile(np.arange(routes_per_zone), len(critical_zones))
+        route_suffix = np.tile([f"_{i:02d}" for i in range(routes_per_zone)], len(critical_zones))
+        zone_ids = np.repeat(critical_zones['zone_id'].to_numpy().astype(str), routes_per_zone)
+        origin_h3 = np.repeat(critical_zones['h3_cell'].to_numpy().astype(str), routes_per_zone)
+        population = np.repeat(critical_zones['affected_population'].to_numpy(), routes_per_zone)
+        
+        routes_df = pd.DataFrame({
+            'route_id': np.char.add(np.char.add('route_', zone_ids), route_suffix),
+            'origin_h3': origin_h3,
+            'destination_h3': np.char.add('safe_', origin_h3),
+            'distance': rng.uniform(2.0, 8.0, size=len(route_num)),
+            'capacity': (population * (1 + route_num * 0.5)).astype(int),
+            'risk_score': np.repeat(critical_zones['adjusted_risk_score'].to_numpy(), routes_per_zone),
+            'status': 'available',
+            'created_at': now
+        })
         
         # Write to Foundry dataset (mock)
         evacuation_routes.write_dataframe(routes_df)
@@ -209,22 +328,28 @@ def h3_udf(lat_col: Any, lon_col: Any, resolution: int) -> Any:
     Mock H3 UDF function for converting lat/lon to H3 cells
     """
     def _h3_convert(df: Any) -> Any:
-        return df.apply(
-            lambda row: f"8928308284{hash((row[lat_col], row[lon_col])) % 100000:05d}", 
-            axis=1
+        cells = MockH3.latlng_to_cell_batch(
+            df[lat_col].to_numpy(), df[lon_col].to_numpy(), resolution
         )
+        return pd.Series(cells, index=df.index)
     return _h3_convert
 
 
-def generate_route_options(origin_h3: str, risk_score: float) -> Any:
+def generate_route_options(origin_h3: str, risk_score: float,
+                           rng: Optional[np.random.Generator] = None) -> Any:
     """
     Mock function to generate evacuation route options
+    Distances come from rng, or NumPy's global random state when not given
     """
+    rng = np.random if rng is None else rng
+    # One draw for all three routes; same sequence as drawing them one at a time
+    distances = rng.uniform(2.0, 8.0, size=3).tolist()
+    
     routes = []
     for i in range(3):
         route = {
             'route_id': f"route_{origin_h3}_{i:02d}",
-            'distance': np.random.uniform(2.0, 8.0),
+            'distance': distances[i],
             'capacity': int(1000 * (1 + i * 0.5)),
             'risk_level': 'low' if i == 0 else 'medium'
         }
@@ -233,23 +358,27 @@ def generate_route_options(origin_h3: str, risk_score: float) -> Any:
     return routes
 
 
-def calculate_spread_probability(intensity: float, wind_speed: float, elevation: float) -> float:
+def calculate_spread_probability(intensity: ArrayLike, wind_speed: ArrayLike, elevation: ArrayLike) -> ArrayLike:
     """
     Mock function to calculate fire spread probability
+    Accepts scalars or whole columns; arrays are computed element-wise in NumPy
     """
     base_prob = intensity / 1000.0
-    wind_factor = min(wind_speed / 30.0, 2.0)
+    wind_factor = np.minimum(wind_speed / 30.0, 2.0)
     elevation_factor = 1.0 + (elevation / 2000.0) * 0.5
     
-    return min(base_prob * wind_factor * elevation_factor, 1.0)
+    return np.minimum(base_prob * wind_factor * elevation_factor, 1.0)
 
 
-def estimate_evacuation_time(population: int, route_capacity: int) -> float:
+def estimate_evacuation_time(population: ArrayLike, route_capacity: ArrayLike) -> ArrayLike:
     """
     Mock function to estimate evacuation time
+    Accepts scalars or whole columns; routes without capacity take forever
     """
-    if route_capacity <= 0:
-        return float('inf')
+    population = np.asarray(population, dtype=float)
+    route_capacity = np.asarray(route_capacity, dtype=float)
     
     # Simple estimation: 2 minutes per 100 people
-    return (population / route_capacity) * 2.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        minutes = np.where(route_capacity <= 0, np.inf, (population / route_capacity) * 2.0)
+    return minutes[()] if minutes.ndim == 0 else minutes
@@ -4,13 +4,100 @@ Python classes for disaster response objects without Foundry dependencies
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Dict, Any, Tuple, get_type_hints
+from dataclasses import dataclass, field, fields
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
-class HazardZone:
+# How a field's value is converted on serialization
+_RAW, _DATETIME, _MODEL = range(3)
+
+
+def _camel_case(name: str) -> str:
+    """snake_case field name to the camelCase key used by the frontend"""
+    head, *rest = name.split('_')
+    return head + ''.join(part[:1].upper() + part[1:] for part in rest)
+
+
+class SerializableModel:
+    """Base for the dataclass models below: camelCase dict and JSON serialization
+    
+    Models are immutable records built once per response, so they are frozen,
+    slotted dataclasses. Each class compiles its own dict builders on first use,
+    so serializing reads every field directly instead of looping over a field list.
+    """
+    
+    __slots__ = ()
+    
+    # Field names in serialized key order, where it differs from declaration order
+    _KEY_ORDER: Tuple[str, ...] = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return _serializers_for(type(self)).to_dict(self)
+    
+    def _json_dict(self) -> Dict[str, Any]:
+        """Like to_dict, but datetimes stay datetime objects for orjson to format"""
+        return _serializers_for(type(self))._json_dict(self)
+    
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes; orjson formats datetimes natively when installed"""
+        if orjson is not None:
+            return orjson.dumps(self._json_dict())
+        return json.dumps(self.to_dict()).encode()
+
+
+def _field_plan(cls: type) -> List[Tuple[str, str, int]]:
+    """(attribute, camelCase key, conversion) per field, in serialized key order"""
+    hints = get_type_hints(cls)
+    plan = []
+    for f in fields(cls):
+        hint = hints[f.name]
+        if hint in (datetime, Optional[datetime]):
+            kind = _DATETIME
+        elif isinstance(hint, type) and issubclass(hint, SerializableModel):
+            kind = _MODEL
+        else:
+            kind = _RAW
+        plan.append((f.name, _camel_case(f.name), kind))
+    if cls._KEY_ORDER:
+        plan.sort(key=lambda entry: cls._KEY_ORDER.index(entry[0]))
+    return plan
+
+
+def _compile_dict_builder(cls: type, method: str, isoformat: bool) -> Callable[[Any], Dict[str, Any]]:
+    """Compile a function returning one dict display over every field of cls"""
+    items = []
+    for name, key, kind in _field_plan(cls):
+        if kind == _DATETIME and isoformat:
+            value = f'(v.isoformat() if (v := self.{name}) else None)'
+        elif kind == _MODEL:
+            value = f'self.{name}.{method}()'
+        else:
+            value = f'self.{name}'
+        items.append(f'        {key!r}: {value},')
+    source = f"def {method}(self):\n    return {{\n" + '\n'.join(items) + "\n    }"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f'<{cls.__name__}.{method}>', 'exec'), namespace)
+    builder = namespace[method]
+    builder.__qualname__ = f'{cls.__qualname__}.{method}'
+    return builder
+
+
+def _serializers_for(cls: type) -> type:
+    """cls, with to_dict/_json_dict builders compiled for its own fields on first use"""
+    if 'to_dict' not in cls.__dict__:
+        cls._json_dict = _compile_dict_builder(cls, '_json_dict', False)
+        cls.to_dict = _compile_dict_builder(cls, 'to_dict', True)
+    return cls
+
+
+@dataclass(frozen=True, slots=True)
+class HazardZone(SerializableModel):
     """Hazard zone model"""
     h3_cell_id: str
     risk_level: str  # 'low', 'medium', 'high', 'critical'
@@ -22,25 +109,10 @@ class HazardZone:
     latest_detection: Optional[datetime] = None
     wind_speed: float = 0.0
     last_updated: Optional[datetime] = None
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "h3CellId": self.h3_cell_id,
-            "riskLevel": self.risk_level,
-            "riskScore": self.risk_score,
-            "intensity": self.intensity,
-            "confidence": self.confidence,
-            "affectedPopulation": self.affected_population,
-            "buildingsAtRisk": self.buildings_at_risk,
-            "latestDetection": self.latest_detection.isoformat() if self.latest_detection else None,
-            "windSpeed": self.wind_speed,
-            "lastUpdated": self.last_updated.isoformat() if self.last_updated else None
-        }
-
-
-@dataclass
-class EmergencyUnit:
+
+
+@dataclass(frozen=True, slots=True)
+class EmergencyUnit(SerializableModel):
     """Emergency unit model"""
     unit_id: str
     call_sign: str
@@ -50,23 +122,10 @@ class EmergencyUnit:
     last_location_update: Optional[datetime] = None
     capacity: int = 0
     equipment: List[str] = field(default_factory=list)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "unitId": self.unit_id,
-            "callSign": self.call_sign,
-            "unitType": self.unit_type,
-            "status": self.status,
-            "currentLocation": self.current_location,
-            "lastLocationUpdate": self.last_location_update.isoformat() if self.last_location_update else None,
-            "capacity": self.capacity,
-            "equipment": self.equipment
-        }
-
-
-@dataclass
-class EvacuationRoute:
+
+
+@dataclass(frozen=True, slots=True)
+class EvacuationRoute(SerializableModel):
     """Evacuation route model"""
     route_id: str
     origin_h3: str
@@ -77,24 +136,10 @@ class EvacuationRoute:
     capacity_per_hour: int
     status: str  # 'safe', 'compromised', 'closed'
     last_updated: Optional[datetime] = None
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "routeId": self.route_id,
-            "originH3": self.origin_h3,
-            "destinationH3": self.destination_h3,
-            "routeGeometry": self.route_geometry,
-            "distanceKm": self.distance_km,
-            "estimatedTimeMinutes": self.estimated_time_minutes,
-            "capacityPerHour": self.capacity_per_hour,
-            "status": self.status,
-            "lastUpdated": self.last_updated.isoformat() if self.last_updated else None
-        }
-
-
-@dataclass
-class Building:
+
+
+@dataclass(frozen=True, slots=True)
+class Building(SerializableModel):
     """Building model"""
     building_id: str
     address: str
@@ -103,22 +148,10 @@ class Building:
     h3_cell: str
     evacuation_status: str  # 'normal', 'ordered', 'evacuated'
     last_status_update: Optional[datetime] = None
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "buildingId": self.building_id,
-            "address": self.address,
-            "buildingType": self.building_type,
-            "occupancy": self.occupancy,
-            "h3Cell": self.h3_cell,
-            "evacuationStatus": self.evacuation_status,
-            "lastStatusUpdate": self.last_status_update.isoformat() if self.last_status_update else None
-        }
-
-
-@dataclass
-class Incident:
+
+
+@dataclass(frozen=True, slots=True)
+class Incident(SerializableModel):
     """Incident model"""
     incident_id: str
     incident_type: str
@@ -128,21 +161,13 @@ class Incident:
     severity: str = 'medium'
     description: str = ''
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "incidentId": self.incident_id,
-            "incidentType": self.incident_type,
-            "locationH3": self.location_h3,
-            "reportedAt": self.reported_at.isoformat() if self.reported_at else None,
-            "status": self.status,
-            "severity": self.severity,
-            "description": self.description
-        }
-
-
-@dataclass
-class EvacuationOrder:
+    # reportedAt has always preceded status in the serialized form
+    _KEY_ORDER = ('incident_id', 'incident_type', 'location_h3', 'reported_at',
+                  'status', 'severity', 'description')
+
+
+@dataclass(frozen=True, slots=True)
+class EvacuationOrder(SerializableModel):
     """Evacuation order model"""
     order_id: str
     zone: HazardZone
@@ -152,23 +177,10 @@ class EvacuationOrder:
     status: str = 'active'  # 'active', 'completed', 'cancelled'
     public_message: str = ''
     affected_population: int = 0
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "orderId": self.order_id,
-            "zone": self.zone.to_dict(),
-            "orderType": self.order_type,
-            "authorizedBy": self.authorized_by,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "status": self.status,
-            "publicMessage": self.public_message,
-            "affectedPopulation": self.affected_population
-        }
-
-
-@dataclass
-class DispatchRecord:
+
+
+@dataclass(frozen=True, slots=True)
+class DispatchRecord(SerializableModel):
     """Dispatch record model"""
     record_id: str
     unit: EmergencyUnit
@@ -176,81 +188,40 @@ class DispatchRecord:
     dispatched_by: str
     dispatch_time: Optional[datetime] = None
     status: str = 'dispatched'
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "recordId": self.record_id,
-            "unit": self.unit.to_dict(),
-            "incident": self.incident.to_dict(),
-            "dispatchedBy": self.dispatched_by,
-            "dispatchTime": self.dispatch_time.isoformat() if self.dispatch_time else None,
-            "status": self.status
-        }
-
-
-@dataclass
-class NotificationRecord:
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationRecord(SerializableModel):
     """Notification record model"""
     notification_id: str
     order: EvacuationOrder
     channel: str
     sent_at: Optional[datetime] = None
     status: str = 'sent'
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "notificationId": self.notification_id,
-            "order": self.order.to_dict(),
-            "channel": self.channel,
-            "sentAt": self.sent_at.isoformat() if self.sent_at else None,
-            "status": self.status
-        }
 
 
-@dataclass
-class RouteUsage:
+@dataclass(frozen=True, slots=True)
+class RouteUsage(SerializableModel):
     """Route usage model"""
     usage_id: str
     route: EvacuationRoute
     timestamp: Optional[datetime] = None
     vehicles_per_hour: int = 0
     average_speed: float = 0.0
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "usageId": self.usage_id,
-            "route": self.route.to_dict(),
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "vehiclesPerHour": self.vehicles_per_hour,
-            "averageSpeed": self.average_speed
-        }
 
 
-@dataclass
-class ComplianceMetric:
+@dataclass(frozen=True, slots=True)
+class ComplianceMetric(SerializableModel):
     """Compliance metric model"""
     metric_id: str
     order: EvacuationOrder
     timestamp: Optional[datetime] = None
     compliance_rate: float = 0.0
     population_evacuated: int = 0
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "metricId": self.metric_id,
-            "order": self.order.to_dict(),
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "complianceRate": self.compliance_rate,
-            "populationEvacuated": self.population_evacuated
-        }
 
 
-@dataclass
-class IncidentUpdate:
+@dataclass(frozen=True, slots=True)
+class IncidentUpdate(SerializableModel):
     """Incident update model"""
     update_id: str
     incident: Incident
@@ -258,14 +229,3 @@ class IncidentUpdate:
     status: str = ''
     notes: str = ''
     updated_by: str = ''
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "updateId": self.update_id,
-            "incident": self.incident.to_dict(),
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "status": self.status,
-            "notes": self.notes,
-            "updatedBy": self.updated_by
-        }
@@ -3,25 +3,119 @@ Challenge-Winning Ontology - Living Data Objects with Actions
 This demonstrates actual Foundry Ontology integration with working Actions and relationships.
 """
 
-from palantir.ontology import ontology_object, PrimaryKey, Link, Action, OntologyTransaction
-from palantir.ontology.types import String, Integer, Double, DateTime, Boolean, List
+from palantir.ontology import ontology_object, PrimaryKey, Link, Action, OntologyTransaction, F
+from palantir.ontology.types import String, Integer, Long, Double, DateTime, Boolean, List
 from palantir.ontology.enums import Enum
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from enum import IntFlag
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple, Union
+import contextvars
+import heapq
+from h3.api import basic_int as h3_int
+from utils.idgen import next_id
+from utils.logging_utils import info_enabled
 import structlog
 import h3
 import json
-import uuid
+import math
 
 logger = structlog.get_logger(__name__)
 
 
+# Timestamp assigned by the ontology store as it applies a write
+SERVER_NOW = F.now()
+
+
+class Equipment(IntFlag):
+    """Unit equipment, one bit per item so a unit's kit is stored as a single integer"""
+    LADDER = 1
+    OXYGEN = 2
+    DEFIBRILLATOR = 4
+    HOSE = 8
+    THERMAL_CAMERA = 16
+    EXTRICATION_TOOLS = 32
+    FOAM = 64
+    STRETCHER = 128
+
+
+# Risk levels that compromise routes and trigger the connected-object fan-out
+_SEVERE_RISK = frozenset({"high", "critical"})
+
+# Building evacuation status for each zone risk level; unknown levels map to "normal"
+_RISK_TO_STATUS = {"critical": "ordered", "high": "ordered", "medium": "prepared", "low": "normal"}
+
+# Units within this many meters of a zone are candidates for evacuation dispatch
+DISPATCH_RADIUS_M = 10000
+
+
+def _cell_int(cell: Union[int, str]) -> int:
+    """H3 cell in its 64-bit integer form; string IDs from API callers are converted"""
+    return cell if isinstance(cell, int) else h3.str_to_int(cell)
+
+
+def _cells_within(cell: int, radius_m: float) -> List[int]:
+    """Grid disk around cell covering at least radius_m, as 64-bit cell integers"""
+    # Neighbouring centres are further apart than one edge, so k edges spans the radius
+    edge_m = h3.average_hexagon_edge_length(h3_int.get_resolution(cell), unit="m")
+    return h3_int.grid_disk(cell, math.ceil(radius_m / edge_m))
+
+
+def _units_within(cell: int, units: Iterable[Any], radius_m: float) -> List[Tuple[float, Any]]:
+    """(great-circle distance in meters, unit) for units located less than radius_m from cell"""
+    origin = h3_int.cell_to_latlng(cell)
+    in_range = []
+    for unit in units:
+        distance = h3.great_circle_distance(origin, h3_int.cell_to_latlng(unit.current_location), unit="m")
+        if distance < radius_m:
+            in_range.append((distance, unit))
+    return in_range
+
+
+class ConcurrentUpdateError(Exception):
+    """An object changed between being read and a conditional write to it; retry the Action"""
+
+
+def _update_where(obj: Any, pk_field: str, where: Dict[str, Any], updates: Dict[str, Any]) -> None:
+    """Apply updates in one conditional statement, then mirror the stored row onto obj"""
+    pk = getattr(obj, pk_field)
+    updated = type(obj).objects().update_where(
+        **{pk_field: pk}, where=where, set=updates, returning=list(updates)
+    )
+    if not updated:
+        raise ConcurrentUpdateError(f"{type(obj).__name__} {pk} changed since it was read")
+    # Returned values include those the store computed, such as SERVER_NOW
+    for name in updates:
+        setattr(obj, name, updated[name])
+
+
+# Audit rows queued by Actions running inside audited_txn()
+_AUDIT_BUFFER: contextvars.ContextVar[List[Dict[str, Any]]] = contextvars.ContextVar("_AUDIT_BUFFER")
+
+
+@contextmanager
+def audited_txn() -> Iterator[OntologyTransaction]:
+    """OntologyTransaction that writes the audit records queued in it as one batch"""
+    buffer: List[Dict[str, Any]] = []
+    token = _AUDIT_BUFFER.set(buffer)
+    try:
+        with OntologyTransaction() as txn:
+            yield txn
+            if buffer:
+                ChallengeAuditRecord.objects().bulk_create(
+                    [ChallengeAuditRecord(**row) for row in buffer]
+                )
+    finally:
+        _AUDIT_BUFFER.reset(token)
+
+
 @ontology_object
 class ChallengeHazardZone:
     """Challenge-winning hazard zone with live Actions and relationships"""
     
     # Primary properties
-    h3_cell_id: str = PrimaryKey()
+    h3_cell_id: int = PrimaryKey()  # H3 cell as a 64-bit integer
     risk_level: String  # "low", "medium", "high", "critical"
     risk_score: Double
     intensity: Double
@@ -38,51 +132,79 @@ class ChallengeHazardZone:
     evacuation_routes = Link(many_to_many)
     affected_buildings = Link(one_to_many)
     
+    # Links read by the Actions below, fetched with the zone in batched joins
+    CONNECTED_LINKS = ("evacuation_routes", "affected_buildings", "assigned_units",
+                       "evacuation_routes.hazard_zones")
+    
+    @classmethod
+    def load_for_update(cls, h3_cell_id: Union[int, str]) -> "ChallengeHazardZone":
+        """Load a zone with its connected objects eager-loaded for the Actions below"""
+        return cls.objects() \
+            .includes(*cls.CONNECTED_LINKS) \
+            .get(h3_cell_id=_cell_int(h3_cell_id))
+    
+    @property
+    def h3_cell_id_str(self) -> str:
+        """Hex string form of the cell, for logs and messages"""
+        return h3.int_to_str(self.h3_cell_id)
+    
     @Action(requires_role="emergency_commander")
     def issue_evacuation_order(self, order_type: str, authorized_by: str) -> "ChallengeEvacuationOrder":
         """Creates evacuation order and updates all connected objects"""
         
         logger.info("Issuing evacuation order", 
-                   zone=self.h3_cell_id, 
+                   zone=self.h3_cell_id_str, 
                    type=order_type, 
                    authorized_by=authorized_by)
         
+        # One timestamp for the order, dispatches and route updates
+        now = datetime.now()
         with OntologyTransaction() as txn:
             # Create evacuation order
             order = ChallengeEvacuationOrder.create(
-                order_id=str(uuid.uuid4()),
+                order_id=next_id(),
                 zone=self,
                 order_type=order_type,
                 authorized_by=authorized_by,
-                timestamp=datetime.now(),
+                timestamp=now,
                 status="active",
-                affected_population=self.affected_population,
-                public_message=f"Evacuation order issued for {self.h3_cell_id} by {authorized_by}"
+                affected_population=self.affected_population
             )
             
             # Update zone status
             self.status = "evacuation_ordered"
             self.save()
             
-            # Dispatch available units
+            # Dispatch available units, matching locations against the cells around the
+            # zone so only units near it are read
+            nearby_cells = _cells_within(self.h3_cell_id, DISPATCH_RADIUS_M)
             available_units = ChallengeEmergencyUnit.objects() \
                 .filter(status="available") \
-                .filter(distance_from(self.h3_cell_id) < 10000) \
-                .order_by("distance_km")
+                .filter(current_location__in=nearby_cells)
+            # The disk's corners reach about sqrt(3) times the radius, so candidates are
+            # checked against their actual distance and the closest ones dispatched
+            in_range = _units_within(self.h3_cell_id, available_units, DISPATCH_RADIUS_M)
             
-            dispatched_count = 0
-            for unit in available_units[:3]:  # Dispatch up to 3 units
-                unit.dispatch_to_evacuation(order)
-                dispatched_count += 1
+            # The store cannot order units by distance, so the limit is applied here:
+            # nsmallest keeps a 3-entry heap instead of sorting every candidate
+            closest = heapq.nsmallest(3, in_range, key=itemgetter(0))
             
-            # Update evacuation routes
-            for route in self.evacuation_routes:
-                route.update_status()
+            # Dispatch up to 3 units, persisting the units and their records in one
+            # batched write each instead of a save per unit
+            units = [unit for _, unit in closest]
+            records = [unit._prepare_dispatch(order, now) for unit in units]
+            ChallengeEmergencyUnit.objects().bulk_update(units, fields=["status", "assigned_zone"])
+            ChallengeDispatchRecord.objects().bulk_create(records)
+            dispatched_count = len(records)
+            
+            # Update evacuation routes, reading the link once
+            routes = list(self.evacuation_routes)
+            ChallengeEvacuationRoute.update_statuses_bulk(routes, now)
             
             logger.info("Evacuation order issued successfully", 
-                       order_id=order.order_id,
+                       order_id=order.order_id.hex(),
                        units_dispatched=dispatched_count,
-                       routes_updated=len(self.evacuation_routes))
+                       routes_updated=len(routes))
             
             return order
     
@@ -91,45 +213,50 @@ class ChallengeHazardZone:
         """Update risk assessment with audit trail"""
         
         logger.info("Updating risk assessment", 
-                   zone=self.h3_cell_id,
+                   zone=self.h3_cell_id_str,
                    old_risk=self.risk_level,
                    new_risk=new_risk_level,
                    assessor=assessor)
         
-        with OntologyTransaction() as txn:
-            # Update risk properties
-            self.risk_level = new_risk_level
-            self.risk_score = new_risk_score
-            self.last_updated = datetime.now()
-            self.save()
+        with audited_txn() as txn:
+            previous_risk_level = self.risk_level
             
-            # Create audit record
-            audit_record = ChallengeAuditRecord.create(
-                record_id=str(uuid.uuid4()),
-                action="risk_assessment_update",
-                target_object=self.h3_cell_id,
-                performed_by=assessor,
-                timestamp=datetime.now(),
-                details=f"Risk updated from {self.risk_level} to {new_risk_level}"
-            )
+            # Update risk properties, provided the level is still the one read above.
+            # The store's timestamp for this write stamps everything else in the Action.
+            _update_where(self, "h3_cell_id",
+                          where={"risk_level": previous_risk_level},
+                          updates={"risk_level": new_risk_level,
+                                   "risk_score": new_risk_score,
+                                   "last_updated": SERVER_NOW})
+            now = self.last_updated
             
             # Update connected objects if risk level changed significantly
-            if new_risk_level in ["high", "critical"] and self.risk_level != new_risk_level:
-                self._update_connected_objects_for_risk_change()
+            if new_risk_level in _SEVERE_RISK and previous_risk_level != new_risk_level:
+                self._update_connected_objects_for_risk_change(new_risk_level, now)
+            
+            # Queue audit record
+            _AUDIT_BUFFER.get().append(dict(
+                record_id=next_id(),
+                action="risk_assessment_update",
+                target_object=self.h3_cell_id_str,
+                performed_by=assessor,
+                timestamp=now,
+                details=f"Risk updated from {previous_risk_level} to {new_risk_level}"
+            ))
             
             logger.info("Risk assessment updated successfully", 
-                       zone=self.h3_cell_id,
+                       zone=self.h3_cell_id_str,
                        new_risk=new_risk_level)
     
-    def _update_connected_objects_for_risk_change(self):
+    def _update_connected_objects_for_risk_change(self, new_risk_level: str, now: datetime):
         """Update connected objects when risk level changes significantly"""
         # Update evacuation routes
-        for route in self.evacuation_routes:
-            route.update_status()
+        ChallengeEvacuationRoute.update_statuses_for_zone(self.h3_cell_id, new_risk_level, now)
         
-        # Update building status
-        for building in self.affected_buildings:
-            building.update_evacuation_status(self.risk_level)
+        # Update building status for the whole zone in one statement
+        ChallengeBuilding.bulk_update_by_zone(
+            self.h3_cell_id, _RISK_TO_STATUS.get(new_risk_level, "normal"), now
+        )
 
 
 @ontology_object
@@ -141,10 +268,10 @@ class ChallengeEmergencyUnit:
     call_sign: String
     unit_type: String  # "fire_engine", "ambulance", "police", "helicopter", "command"
     status: String  # "available", "dispatched", "en_route", "on_scene", "returning"
-    current_location: String  # H3 cell
+    current_location: Long  # H3 cell as a 64-bit integer
     last_location_update: DateTime
     capacity: Integer
-    equipment: List[String]
+    equipment_mask: Integer  # Equipment flags
     
     # Relationships
     @Link(many_to_one)
@@ -153,38 +280,55 @@ class ChallengeEmergencyUnit:
     @Link(one_to_many)
     dispatch_history
     
+    @property
+    def equipment(self) -> List[str]:
+        """Equipment names decoded from equipment_mask, for logs and display"""
+        return [item.name.lower() for item in Equipment if self.equipment_mask & item]
+    
+    def has_equipment(self, required: Equipment) -> bool:
+        """Whether this unit carries every item in required"""
+        return self.equipment_mask & required == required
+    
+    @classmethod
+    def equipped_with(cls, required: Equipment):
+        """Query for units carrying every item in required, tested as one bitwise AND"""
+        return cls.objects().filter(equipment_mask__bitand=int(required))
+    
     @Action(requires_role="dispatcher")
     def dispatch_to_evacuation(self, evacuation_order: "ChallengeEvacuationOrder") -> "ChallengeDispatchRecord":
         """Dispatch unit for evacuation support"""
         
         logger.info("Dispatching unit to evacuation", 
                    unit=self.call_sign, 
-                   order_id=evacuation_order.order_id)
+                   order_id=evacuation_order.order_id.hex())
         
         with OntologyTransaction() as txn:
-            # Create dispatch record
-            record = ChallengeDispatchRecord.create(
-                record_id=str(uuid.uuid4()),
-                unit=self,
-                evacuation_order=evacuation_order,
-                dispatched_by="system",
-                dispatch_time=datetime.now(),
-                status="dispatched"
-            )
-            
-            # Update unit status
-            self.status = "dispatched"
-            self.assigned_zone = evacuation_order.zone
+            record = self._prepare_dispatch(evacuation_order, datetime.now())
+            record.save()
             self.save()
             
             logger.info("Unit dispatched successfully", 
                        unit=self.call_sign,
-                       record_id=record.record_id)
+                       record_id=record.record_id.hex())
             
             return record
     
+    def _prepare_dispatch(self, evacuation_order: "ChallengeEvacuationOrder",
+                          dispatch_time: datetime) -> "ChallengeDispatchRecord":
+        """Mark this unit dispatched in memory and build its unsaved dispatch record"""
+        self.status = "dispatched"
+        self.assigned_zone = evacuation_order.zone
+        return ChallengeDispatchRecord(
+            record_id=next_id(),
+            unit=self,
+            evacuation_order=evacuation_order,
+            dispatched_by="system",
+            dispatch_time=dispatch_time,
+            status="dispatched"
+        )
+    
     @Action(requires_role="dispatcher")
-    def update_location(self, new_location: str, updated_by: str):
+    def update_location(self, new_location: Union[int, str], updated_by: str):
         """Update unit location with audit trail"""
         
         logger.info("Updating unit location", 
@@ -193,21 +337,23 @@ class ChallengeEmergencyUnit:
                    new_location=new_location,
                    updated_by=updated_by)
         
-        with OntologyTransaction() as txn:
-            # Update location
-            self.current_location = new_location
-            self.last_location_update = datetime.now()
-            self.save()
+        with audited_txn() as txn:
+            # Update location, provided the unit has not moved since it was read
+            _update_where(self, "unit_id",
+                          where={"current_location": self.current_location},
+                          updates={"current_location": _cell_int(new_location),
+                                   "last_location_update": SERVER_NOW})
+            now = self.last_location_update
             
-            # Create audit record
-            audit_record = ChallengeAuditRecord.create(
-                record_id=str(uuid.uuid4()),
+            # Queue audit record
+            _AUDIT_BUFFER.get().append(dict(
+                record_id=next_id(),
                 action="location_update",
                 target_object=self.unit_id,
                 performed_by=updated_by,
-                timestamp=datetime.now(),
-                details=f"Location updated to {new_location}"
-            )
+                timestamp=now,
+                details=f"Location updated to {h3.int_to_str(self.current_location)}"
+            ))
             
             logger.info("Unit location updated successfully", 
                        unit=self.call_sign,
@@ -220,8 +366,8 @@ class ChallengeEvacuationRoute:
     
     # Primary properties
     route_id: str = PrimaryKey()
-    origin_h3: String
-    destination_h3: String
+    origin_h3: Long  # H3 cells as 64-bit integers
+    destination_h3: Long
     route_geometry: String  # GeoJSON
     distance_km: Double
     estimated_time_minutes: Integer
@@ -244,25 +390,75 @@ class ChallengeEvacuationRoute:
         logger.info("Updating route status", route=self.route_id)
         
         with OntologyTransaction() as txn:
-            # Check for compromised hazards
-            compromised_hazards = [h for h in self.hazard_zones 
-                                 if h.risk_level in ["high", "critical"]]
-            
-            if compromised_hazards:
-                self.status = "compromised"
-                logger.warning("Route compromised", 
-                              route=self.route_id, 
-                              hazard_count=len(compromised_hazards))
-            else:
-                self.status = "safe"
-            
-            self.last_updated = datetime.now()
-            self.save()
+            self._apply_hazard_status(self.hazard_zones)
+            _update_where(self, "route_id", where={},
+                          updates={"status": self.status, "last_updated": SERVER_NOW})
             
             logger.info("Route status updated", 
                        route=self.route_id,
                        new_status=self.status)
     
+    @classmethod
+    def update_statuses_bulk(cls, routes: List["ChallengeEvacuationRoute"],
+                             now: Optional[datetime] = None):
+        """Update many route statuses with one hazard query and one batched write"""
+        if not routes:
+            return
+        
+        logger.info("Updating route statuses", route_count=len(routes))
+        
+        with OntologyTransaction() as txn:
+            # One query over the route/hazard links instead of one per route, loading
+            # only the key and the link rather than whole route rows
+            hazards_by_route = {
+                linked.route_id: linked.hazard_zones
+                for linked in cls.objects()
+                    .filter(route_id__in=[route.route_id for route in routes])
+                    .only("route_id")
+                    .includes("hazard_zones")
+            }
+            
+            now = now or datetime.now()
+            for route in routes:
+                route._apply_hazard_status(hazards_by_route.get(route.route_id, []))
+                route.last_updated = now
+            cls.objects().bulk_update(routes, fields=["status", "last_updated"])
+    
+    @classmethod
+    def update_statuses_for_zone(cls, zone_id: int, new_risk_level: str, now: datetime):
+        """Re-rate every route through a zone for its new risk level in one batched write"""
+        # Routes arrive with their hazard zones from a single join
+        routes = list(cls.objects()
+                      .filter(hazard_zones__h3_cell_id=zone_id)
+                      .includes("hazard_zones"))
+        if not routes:
+            return
+        
+        logger.info("Updating route statuses", zone=h3.int_to_str(zone_id), route_count=len(routes))
+        
+        # The zone's new level is applied explicitly rather than read back from the join
+        risk_overrides = {zone_id: new_risk_level}
+        for route in routes:
+            route._apply_hazard_status(route.hazard_zones, risk_overrides)
+            route.last_updated = now
+        cls.objects().bulk_update(routes, fields=["status", "last_updated"])
+    
+    def _apply_hazard_status(self, hazard_zones: List[ChallengeHazardZone],
+                             risk_overrides: Optional[Dict[int, str]] = None):
+        """Set status from the given hazard zones in memory, without saving"""
+        risk_overrides = risk_overrides or {}
+        # Check for compromised hazards
+        compromised_hazards = [h for h in hazard_zones 
+                             if risk_overrides.get(h.h3_cell_id, h.risk_level) in _SEVERE_RISK]
+        
+        if compromised_hazards:
+            self.status = "compromised"
+            logger.warning("Route compromised", 
+                          route=self.route_id, 
+                          hazard_count=len(compromised_hazards))
+        else:
+            self.status = "safe"
+    
     @Action(requires_role="route_manager")
     def record_usage(self, vehicles_per_hour: int, recorded_by: str):
         """Record route usage for capacity planning"""
@@ -275,7 +471,7 @@ class ChallengeEvacuationRoute:
         with OntologyTransaction() as txn:
             # Create usage record
             usage_record = ChallengeRouteUsage.create(
-                usage_id=str(uuid.uuid4()),
+                usage_id=next_id(),
                 route=self,
                 vehicles_per_hour=vehicles_per_hour,
                 recorded_by=recorded_by,
@@ -291,7 +487,7 @@ class ChallengeEvacuationRoute:
             
             logger.info("Route usage recorded successfully", 
                        route=self.route_id,
-                       usage_id=usage_record.usage_id)
+                       usage_id=usage_record.usage_id.hex())
 
 
 @ontology_object
@@ -299,14 +495,13 @@ class ChallengeEvacuationOrder:
     """Challenge-winning evacuation order with full audit trail"""
     
     # Primary properties
-    order_id: str = PrimaryKey()
+    order_id: bytes = PrimaryKey()  # 16-byte ID from utils.idgen
     zone: ChallengeHazardZone
     order_type: String  # "mandatory", "voluntary", "shelter_in_place"
     authorized_by: String
     timestamp: DateTime
     status: String  # "active", "completed", "cancelled"
     affected_population: Integer
-    public_message: String
     
     # Relationships
     @Link(one_to_many)
@@ -315,35 +510,47 @@ class ChallengeEvacuationOrder:
     @Link(one_to_many)
     compliance_metrics
     
+    @property
+    def public_message(self) -> str:
+        """Default notification text, formatted from the zone and authorizer when read"""
+        return f"Evacuation order issued for {self.zone.h3_cell_id_str} by {self.authorized_by}"
+    
     @Action(requires_role="emergency_commander")
     def send_notifications(self, channels: List[str], message: str = None):
         """Send notifications across multiple channels"""
         
         logger.info("Sending evacuation notifications", 
-                   order_id=self.order_id,
+                   order_id=self.order_id.hex(),
                    channels=channels)
         
         with OntologyTransaction() as txn:
             notification_message = message or self.public_message
+            sent_at = datetime.now()
             
-            for channel in channels:
-                notification = ChallengeNotificationRecord.create(
-                    notification_id=str(uuid.uuid4()),
+            # One record per channel, written in a single batch
+            notifications = [
+                ChallengeNotificationRecord(
+                    notification_id=next_id(),
                     order=self,
                     channel=channel,
                     message=notification_message,
-                    sent_at=datetime.now(),
+                    sent_at=sent_at,
                     status="sent"
                 )
-                
-                # In real implementation, this would trigger actual notifications
-                logger.info("Notification sent", 
-                           order=self.order_id, 
-                           channel=channel,
-                           notification_id=notification.notification_id)
+                for channel in channels
+            ]
+            ChallengeNotificationRecord.objects().bulk_create(notifications)
+            
+            # In real implementation, this would trigger actual notifications
+            if info_enabled(logger):
+                for notification in notifications:
+                    logger.info("Notification sent", 
+                               order=self.order_id.hex(), 
+                               channel=notification.channel,
+                               notification_id=notification.notification_id.hex())
             
             logger.info("All notifications sent successfully", 
-                       order_id=self.order_id,
+                       order_id=self.order_id.hex(),
                        channels_count=len(channels))
     
     @Action(requires_role="emergency_commander")
@@ -351,28 +558,31 @@ class ChallengeEvacuationOrder:
         """Update evacuation order status"""
         
         logger.info("Updating evacuation order status", 
-                   order_id=self.order_id,
+                   order_id=self.order_id.hex(),
                    old_status=self.status,
                    new_status=new_status,
                    updated_by=updated_by)
         
-        with OntologyTransaction() as txn:
-            # Update status
-            self.status = new_status
-            self.save()
+        with audited_txn() as txn:
+            previous_status = self.status
             
-            # Create audit record
-            audit_record = ChallengeAuditRecord.create(
-                record_id=str(uuid.uuid4()),
+            # Update status, provided it is still the one read above
+            _update_where(self, "order_id",
+                          where={"status": previous_status},
+                          updates={"status": new_status})
+            
+            # Queue audit record
+            _AUDIT_BUFFER.get().append(dict(
+                record_id=next_id(),
                 action="status_update",
-                target_object=self.order_id,
+                target_object=self.order_id.hex(),
                 performed_by=updated_by,
                 timestamp=datetime.now(),
-                details=f"Status updated from {self.status} to {new_status}. Reason: {reason or 'Not specified'}"
-            )
+                details=f"Status updated from {previous_status} to {new_status}. Reason: {reason or 'Not specified'}"
+            ))
             
             logger.info("Evacuation order status updated successfully", 
-                       order_id=self.order_id,
+                       order_id=self.order_id.hex(),
                        new_status=new_status)
 
 
@@ -385,7 +595,7 @@ class ChallengeBuilding:
     address: String
     building_type: String
     occupancy: Integer
-    h3_cell: String
+    h3_cell: Long  # H3 cell as a 64-bit integer
     evacuation_status: String  # "normal", "ordered", "evacuated"
     last_status_update: DateTime
     
@@ -404,77 +614,99 @@ class ChallengeBuilding:
         
         with OntologyTransaction() as txn:
             # Determine new status based on risk level
-            if risk_level in ["critical", "high"]:
-                new_status = "ordered"
-            elif risk_level == "medium":
-                new_status = "prepared"
-            else:
-                new_status = "normal"
+            new_status = _RISK_TO_STATUS.get(risk_level, "normal")
             
             # Update status
-            self.evacuation_status = new_status
-            self.last_status_update = datetime.now()
-            self.save()
+            _update_where(self, "building_id", where={},
+                          updates={"evacuation_status": new_status,
+                                   "last_status_update": SERVER_NOW})
             
             logger.info("Building evacuation status updated", 
                        building=self.building_id,
                        new_status=new_status)
+    
+    @classmethod
+    def bulk_update_by_zone(cls, zone_id: int, new_status: str, now: datetime):
+        """Set the evacuation status of every building in a zone with one update"""
+        updated = cls.objects() \
+            .filter(hazard_zone__h3_cell_id=zone_id) \
+            .update(evacuation_status=new_status, last_status_update=now)
+        
+        logger.info("Zone building evacuation statuses updated", 
+                   zone=h3.int_to_str(zone_id),
+                   new_status=new_status,
+                   buildings_updated=updated)
 
 
-# Supporting objects for audit trail and metrics
+# Supporting objects for audit trail and metrics. These are created in bulk, so their
+# declared fields live in slots; __dict__ stays for the primary key, which is a class
+# attribute and cannot be a slot, and for any state the ontology runtime attaches
 @ontology_object
 class ChallengeAuditRecord:
     """Audit record for all ontology actions"""
     
-    record_id: str = PrimaryKey()
+    record_id: bytes = PrimaryKey()  # 16-byte ID from utils.idgen
     action: String
     target_object: String
     performed_by: String
     timestamp: DateTime
     details: String
+    
+    __slots__ = ("action", "target_object", "performed_by",
+                 "timestamp", "details", "__dict__")
 
 
 @ontology_object
 class ChallengeDispatchRecord:
     """Dispatch record for emergency units"""
     
-    record_id: str = PrimaryKey()
+    record_id: bytes = PrimaryKey()  # 16-byte ID from utils.idgen
     unit: ChallengeEmergencyUnit
     evacuation_order: ChallengeEvacuationOrder
     dispatched_by: String
     dispatch_time: DateTime
     status: String
+    
+    __slots__ = ("unit", "evacuation_order", "dispatched_by",
+                 "dispatch_time", "status", "__dict__")
 
 
 @ontology_object
 class ChallengeRouteUsage:
     """Route usage tracking"""
     
-    usage_id: str = PrimaryKey()
+    usage_id: bytes = PrimaryKey()  # 16-byte ID from utils.idgen
     route: ChallengeEvacuationRoute
     vehicles_per_hour: Integer
     recorded_by: String
     timestamp: DateTime
+    
+    __slots__ = ("route", "vehicles_per_hour", "recorded_by", "timestamp", "__dict__")
 
 
 @ontology_object
 class ChallengeNotificationRecord:
     """Notification tracking"""
     
-    notification_id: str = PrimaryKey()
+    notification_id: bytes = PrimaryKey()  # 16-byte ID from utils.idgen
     order: ChallengeEvacuationOrder
     channel: String
     message: String
     sent_at: DateTime
     status: String
+    
+    __slots__ = ("order", "channel", "message", "sent_at", "status", "__dict__")
 
 
 @ontology_object
 class ChallengeComplianceMetric:
     """Compliance tracking for evacuation orders"""
     
-    metric_id: str = PrimaryKey()
+    metric_id: bytes = PrimaryKey()  # 16-byte ID from utils.idgen
     order: ChallengeEvacuationOrder
     compliance_rate: Double
     population_evacuated: Integer
     recorded_at: DateTime
+    
+    __slots__ = ("order", "compliance_rate", "population_evacuated",
+                 "recorded_at", "__dict__")
@@ -21,6 +21,10 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
+# Risk levels that compromise evacuation routes
+_SEVERE_RISK = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
+
+
 class UnitType(Enum):
     """Emergency unit types"""
     FIRE_ENGINE = "fire_engine"
@@ -92,8 +96,8 @@ class HazardZone:
     
     def _update_connected_objects(self, order: "EvacuationOrder"):
         """Update all connected objects when evacuation is ordered"""
-        # Mark routes as compromised
-        for route in self.evacuation_routes:
+        # Mark routes as compromised; only the status fields are loaded
+        for route in self.evacuation_routes.only(*EvacuationRoute.STATUS_FIELDS):
             route.status = "compromised"
             route.save()
         
@@ -103,7 +107,7 @@ class HazardZone:
                 unit.dispatch_to_evacuation(order)
         
         # Update building status
-        for building in self.affected_buildings:
+        for building in self.affected_buildings.only(*Building.STATUS_FIELDS):
             building.evacuation_status = "ordered"
             building.save()
 
@@ -183,6 +187,9 @@ class EvacuationRoute:
     status: String  # "safe", "compromised", "closed"
     last_updated: DateTime
     
+    # Fields loaded by bulk status updates that touch nothing else
+    STATUS_FIELDS = ("route_id", "status", "last_updated")
+    
     # Relationships
     @Link(many_to_many)
     hazard_zones: List[HazardZone]
@@ -192,7 +199,7 @@ class EvacuationRoute:
     
     def update_status(self):
         """Automatically update route status based on hazard zones"""
-        compromised_hazards = [h for h in self.hazard_zones if h.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]]
+        compromised_hazards = [h for h in self.hazard_zones if h.risk_level in _SEVERE_RISK]
         
         if compromised_hazards:
             self.status = "compromised"
@@ -255,6 +262,9 @@ class Building:
     evacuation_status: String  # "normal", "ordered", "evacuated"
     last_status_update: DateTime
     
+    # Fields loaded by bulk status updates that touch nothing else
+    STATUS_FIELDS = ("building_id", "hazard_zone", "evacuation_status", "last_status_update")
+    
     # Relationships
     @Link(many_to_one)
     hazard_zone: Optional[HazardZone]
@@ -0,0 +1,68 @@
+"""
+Unit search around hazard zones
+Nearest-unit lookups over H3 cells, shared by the ontology Actions that dispatch units.
+Depends only on h3, so it can be exercised without the Foundry SDK.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, List
+import heapq
+import math
+import h3
+
+
+@lru_cache(maxsize=1024)
+def h3_cells_within(cell: str, meters: float) -> FrozenSet[str]:
+    """Cells covering the disk of the given radius around cell's centre"""
+    edge_m = h3.average_hexagon_edge_length(h3.get_resolution(cell), unit="m")
+    origin = h3.cell_to_latlng(cell)
+    # A cell can overlap the disk while its centre lies up to one edge outside it
+    reach = meters + edge_m
+    return frozenset(
+        c for c in h3.grid_disk(cell, math.ceil(meters / edge_m))
+        if h3.great_circle_distance(origin, h3.cell_to_latlng(c), unit="m") <= reach
+    )
+
+
+def nearest_available_units(objects: Callable[[], Any], cell: str, count: int, radius_m: float) -> List[Any]:
+    """Closest available units within radius_m of cell, searched outwards by H3 rings
+    
+    objects returns a fresh query over the unit type, e.g. WorkingEmergencyUnit.objects;
+    units need unit_id, status and current_location (an H3 cell string).
+    """
+    edge_m = h3.average_hexagon_edge_length(h3.get_resolution(cell), unit="m")
+    max_ring = math.ceil(radius_m / edge_m)
+    # Cells inside the radius buffer; the hexagonal disk's corners beyond it are skipped
+    within = h3_cells_within(cell, radius_m)
+    origin = h3.cell_to_latlng(cell)
+    
+    # Each step doubles the disk and queries only its new cells, so a nearby fleet is
+    # found with one or two indexed lookups and an empty area costs O(log rings) of them
+    searched = set()
+    distances = {}
+    candidates = []
+    ring = 0
+    while True:
+        new_cells = [c for c in h3.grid_disk(cell, ring) if c in within and c not in searched]
+        searched.update(new_cells)
+        for unit in objects() \
+                .filter(status="available") \
+                .filter(current_location__in=new_cells):
+            distance = h3.great_circle_distance(origin, h3.cell_to_latlng(unit.current_location), unit="m")
+            if distance < radius_m:
+                distances[unit.unit_id] = distance
+                candidates.append(unit)
+        if ring >= max_ring:
+            break
+        if len(candidates) >= count:
+            # Disk k holds every cell centre within about 1.5*k edges but its corners
+            # reach sqrt(3)*k edges, so a closer unit may still sit just outside it.
+            # Grow the disk once more until that bound covers the count-th distance.
+            kth_distance = heapq.nsmallest(count, distances.values())[-1]
+            if 1.5 * ring * edge_m >= kth_distance:
+                break
+            ring = min(max(ring + 1, math.ceil(kth_distance / (1.5 * edge_m))), max_ring)
+        else:
+            ring = min(max(1, ring * 2), max_ring)
+    
+    return heapq.nsmallest(count, candidates, key=lambda unit: distances[unit.unit_id])
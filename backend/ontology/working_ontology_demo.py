@@ -12,8 +12,22 @@ import structlog
 import h3
 import json
 
+from ontology.unit_search import nearest_available_units
+
 logger = structlog.get_logger(__name__)
 
+# Isolation for Actions confined to one zone's order and units. The zone's primary key
+# is their conflict domain, so snapshot isolation is enough; cross-zone Actions keep
+# the serializable default
+ZONE_ISOLATION = "snapshot"
+
+# Evacuation orders dispatch up to this many available units within the radius
+DISPATCH_UNIT_COUNT = 3
+DISPATCH_RADIUS_M = 10000
+
+# Notification text shared by every channel; t is the order type, z the zone cell
+_BASE_NOTIFICATION = "EVACUATION ORDER: {t} evacuation for {z}"
+
 
 @ontology_object
 class WorkingHazardZone:
@@ -44,33 +58,35 @@ class WorkingHazardZone:
                    type=order_type, 
                    authorized_by=authorized_by)
         
-        with OntologyTransaction() as txn:
-            # Create evacuation order
-            order = WorkingEvacuationOrder.create(
+        now = datetime.now()
+        with OntologyTransaction(isolation=ZONE_ISOLATION) as txn:
+            # Create evacuation order; the zone and order are written in one batch at
+            # the end instead of a save each
+            order = WorkingEvacuationOrder(
                 zone=self,
                 order_type=order_type,
                 authorized_by=authorized_by,
-                timestamp=datetime.now(),
+                timestamp=now,
                 status="active",
                 affected_population=self.affected_population
             )
             
-            # Update zone status
+            # Update zone status, writing it with the order so dispatch records can
+            # reference the saved order
             self.status = "evacuation_ordered"
-            self.save()
-            
-            # Dispatch available units
-            available_units = WorkingEmergencyUnit.objects() \
-                .filter(status="available") \
-                .filter(distance_from(self.h3_cell_id) < 10000) \
-                .order_by("distance_km")
+            txn.bulk_save([self, order])
             
-            for unit in available_units[:3]:  # Dispatch up to 3 units
-                unit.dispatch_to_evacuation(order)
+            # Dispatch up to 3 units: records are built in memory, then created and the
+            # units updated with one bulk write each
+            units = nearest_available_units(WorkingEmergencyUnit.objects, self.h3_cell_id,
+                                            DISPATCH_UNIT_COUNT, DISPATCH_RADIUS_M)
+            records = [unit._prepare_dispatch(order, now) for unit in units]
+            WorkingDispatchRecord.objects().bulk_create(records)
+            WorkingEmergencyUnit.objects().bulk_update(units, fields=["status", "assigned_zone"])
             
             logger.info("Evacuation order issued successfully", 
                        order_id=order.order_id,
-                       units_dispatched=available_units.count())
+                       units_dispatched=len(units))
             
             return order
     
@@ -83,28 +99,32 @@ class WorkingHazardZone:
                    status=status, 
                    updated_by=updated_by)
         
-        with OntologyTransaction() as txn:
+        with OntologyTransaction(isolation=ZONE_ISOLATION) as txn:
             # Update status
             self.status = status
             self.last_updated = datetime.now()
             self.save()
             
-            # If contained, release units
+            # Read the link once
+            units = list(self.assigned_units)
+            units_affected = len(units)
+            
+            # If contained, release units with one bulk write
             if status == "contained":
-                for unit in self.assigned_units:
+                for unit in units:
                     unit.status = "available"
                     unit.assigned_zone = None
-                    unit.save()
+                WorkingEmergencyUnit.objects().bulk_update(units, fields=["status", "assigned_zone"])
                 
                 logger.info("Fire contained, units released", 
                            zone=self.h3_cell_id,
-                           units_released=len(self.assigned_units))
+                           units_released=units_affected)
             
             return {
                 "zone_id": self.h3_cell_id,
                 "new_status": status,
                 "updated_at": self.last_updated.isoformat(),
-                "units_affected": len(self.assigned_units)
+                "units_affected": units_affected
             }
 
 
@@ -137,19 +157,8 @@ class WorkingEmergencyUnit:
                    order_id=evacuation_order.order_id)
         
         with OntologyTransaction() as txn:
-            # Create dispatch record
-            record = WorkingDispatchRecord.create(
-                unit=self,
-                evacuation_order=evacuation_order,
-                dispatched_by="system",
-                dispatch_time=datetime.now(),
-                status="dispatched"
-            )
-            
-            # Update unit status
-            self.status = "dispatched"
-            self.assigned_zone = evacuation_order.zone
-            self.save()
+            record = self._prepare_dispatch(evacuation_order, datetime.now())
+            txn.bulk_save([record, self])
             
             logger.info("Unit dispatched successfully", 
                        unit=self.call_sign,
@@ -157,6 +166,22 @@ class WorkingEmergencyUnit:
             
             return record
     
+    def _prepare_dispatch(self, evacuation_order: "WorkingEvacuationOrder",
+                          dispatch_time: datetime) -> "WorkingDispatchRecord":
+        """Mark this unit dispatched in memory and build its unsaved dispatch record"""
+        # Update unit status
+        self.status = "dispatched"
+        self.assigned_zone = evacuation_order.zone
+        
+        # Create dispatch record
+        return WorkingDispatchRecord(
+            unit=self,
+            evacuation_order=evacuation_order,
+            dispatched_by="system",
+            dispatch_time=dispatch_time,
+            status="dispatched"
+        )
+    
     @Action(requires_role="unit_commander")
     def update_location(self, new_location: str, updated_by: str) -> Dict[str, Any]:
         """Update unit location"""
@@ -213,6 +238,13 @@ class WorkingEvacuationOrder:
     @Link(one_to_many)
     assigned_units
     
+    # Message format per channel; unknown channels get the bare order line
+    _CHANNEL_TEMPLATES = {
+        "sms": _BASE_NOTIFICATION + ". Leave immediately via designated routes.",
+        "email": _BASE_NOTIFICATION + ". Please evacuate immediately using designated evacuation routes. Emergency shelters available.",
+        "emergency_broadcast": "EMERGENCY: " + _BASE_NOTIFICATION + ". All residents must evacuate immediately.",
+    }
+    
     @Action(requires_role="emergency_commander")
     def send_notifications(self, channels: List[str]) -> List["WorkingNotificationRecord"]:
         """Send notifications across multiple channels"""
@@ -221,24 +253,27 @@ class WorkingEvacuationOrder:
                    order_id=self.order_id, 
                    channels=channels)
         
-        notifications = []
+        order_type = self.order_type.upper()
+        zone_id = self.zone.h3_cell_id
+        sent_at = datetime.now()
         
-        with OntologyTransaction() as txn:
-            for channel in channels:
-                notification = WorkingNotificationRecord.create(
+        with OntologyTransaction(isolation=ZONE_ISOLATION) as txn:
+            # One record per channel, created with a single bulk insert
+            notifications = [
+                WorkingNotificationRecord(
                     order=self,
                     channel=channel,
-                    sent_at=datetime.now(),
+                    sent_at=sent_at,
                     status="sent",
-                    message=self._generate_notification_message(channel)
+                    message=self._generate_notification_message(channel, order_type, zone_id)
                 )
-                
-                notifications.append(notification)
-                
-                logger.info("Notification sent", 
-                           order_id=self.order_id, 
-                           channel=channel,
-                           notification_id=notification.notification_id)
+                for channel in channels
+            ]
+            WorkingNotificationRecord.objects().bulk_create(notifications)
+            
+            logger.info("Notifications sent", 
+                       order_id=self.order_id, 
+                       channels_count=len(channels))
         
         return notifications
     
@@ -250,13 +285,15 @@ class WorkingEvacuationOrder:
                    order_id=self.order_id, 
                    completed_by=completed_by)
         
-        with OntologyTransaction() as txn:
+        with OntologyTransaction(isolation=ZONE_ISOLATION) as txn:
             # Update order status
             self.status = "completed"
             self.save()
             
-            # Release assigned units
-            for unit in self.assigned_units:
+            # Release assigned units, reading the link once
+            units = list(self.assigned_units)
+            units_released = len(units)
+            for unit in units:
                 unit.status = "available"
                 unit.assigned_zone = None
                 unit.save()
@@ -267,28 +304,23 @@ class WorkingEvacuationOrder:
             
             logger.info("Evacuation completed", 
                        order_id=self.order_id,
-                       units_released=len(self.assigned_units))
+                       units_released=units_released)
             
             return {
                 "order_id": self.order_id,
                 "status": "completed",
                 "completed_at": datetime.now().isoformat(),
-                "units_released": len(self.assigned_units)
+                "units_released": units_released
             }
     
-    def _generate_notification_message(self, channel: str) -> str:
+    def _generate_notification_message(self, channel: str, order_type: Optional[str] = None,
+                                       zone_id: Optional[str] = None) -> str:
         """Generate notification message for different channels"""
         
-        base_message = f"EVACUATION ORDER: {self.order_type.upper()} evacuation for {self.zone.h3_cell_id}"
-        
-        if channel == "sms":
-            return f"{base_message}. Leave immediately via designated routes."
-        elif channel == "email":
-            return f"{base_message}. Please evacuate immediately using designated evacuation routes. Emergency shelters available."
-        elif channel == "emergency_broadcast":
-            return f"EMERGENCY: {base_message}. All residents must evacuate immediately."
-        else:
-            return base_message
+        return self._CHANNEL_TEMPLATES.get(channel, _BASE_NOTIFICATION).format(
+            t=order_type or self.order_type.upper(),
+            z=zone_id or self.zone.h3_cell_id
+        )
 
 
 @ontology_object
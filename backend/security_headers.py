@@ -4,46 +4,57 @@ Security headers middleware for Flask application
 
 from flask import request, make_response, Response
 from typing import Any, Union
-import re
+
+# Content Security Policy - Updated to allow localhost connections
+CSP_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://api.mapbox.com; "
+    "style-src 'self' 'unsafe-inline' https://api.mapbox.com; "
+    "img-src 'self' data: https://api.mapbox.com https://*.tiles.mapbox.com; "
+    "font-src 'self' https://api.mapbox.com; "
+    "connect-src 'self' http://localhost:3000 http://localhost:8000 https://api.mapbox.com https://firms.modaps.eosdis.nasa.gov https://api.weather.gov; "
+    "frame-ancestors 'none';"
+)
+
+# Built once at import; every response gets the same values
+SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'DENY'),
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Strict-Transport-Security', 'max-age=31536000; includeSubDomains'),
+    ('Content-Security-Policy', CSP_POLICY),
+    ('Referrer-Policy', 'strict-origin-when-cross-origin'),
+    ('Permissions-Policy', 'geolocation=(), microphone=(), camera=()'),
+)
+
+CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', 'http://localhost:3000'),
+    ('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Content-Type, Authorization'),
+    ('Access-Control-Allow-Credentials', 'true'),
+)
 
 def add_security_headers(response: Response) -> Response:
     """Add security headers to all responses"""
     
-    # Content Security Policy - Updated to allow localhost connections
-    csp_policy = (
-        "default-src 'self'; "
-        "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://api.mapbox.com; "
-        "style-src 'self' 'unsafe-inline' https://api.mapbox.com; "
-        "img-src 'self' data: https://api.mapbox.com https://*.tiles.mapbox.com; "
-        "font-src 'self' https://api.mapbox.com; "
-        "connect-src 'self' http://localhost:3000 http://localhost:8000 https://api.mapbox.com https://firms.modaps.eosdis.nasa.gov https://api.weather.gov; "
-        "frame-ancestors 'none';"
-    )
-    
-    # Security headers (but preserve CORS headers)
-    response.headers['X-Content-Type-Options'] = 'nosniff'
-    response.headers['X-Frame-Options'] = 'DENY'
-    response.headers['X-XSS-Protection'] = '1; mode=block'
-    response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-    response.headers['Content-Security-Policy'] = csp_policy
-    response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-    response.headers['Permissions-Policy'] = 'geolocation=(), microphone=(), camera=()'
+    # Security headers (but preserve CORS headers); update replaces existing values
+    response.headers.update(SECURITY_HEADERS)
     
     # Ensure CORS headers are preserved
     if 'Access-Control-Allow-Origin' not in response.headers:
         # Add CORS headers if they're missing
-        response.headers['Access-Control-Allow-Origin'] = 'http://localhost:3000'
-        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, DELETE, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
-        response.headers['Access-Control-Allow-Credentials'] = 'true'
+        response.headers.update(CORS_HEADERS)
     
     return response
 
+# Characters stripped from string input
+_STRIP_TABLE = str.maketrans('', '', '<>"\'')
+
 def validate_input(data: Any) -> Any:
     """Basic input validation and sanitization"""
     if isinstance(data, str):
         # Remove potentially dangerous characters
-        data = re.sub(r'[<>"\']', '', data)
+        data = data.translate(_STRIP_TABLE)
         # Limit length
         if len(data) > 1000:
             return data[:1000]
@@ -0,0 +1,80 @@
+import json
+import os
+import sys
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Optional, get_type_hints
+
+import pytest
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.disaster_models import (
+    Building, ComplianceMetric, DispatchRecord, EmergencyUnit, EvacuationOrder, EvacuationRoute,
+    HazardZone, Incident, IncidentUpdate, NotificationRecord, RouteUsage, SerializableModel
+)
+
+REPORTED = datetime(2024, 8, 1, 12, 30, 15, 250000)
+
+# Serialized keys of every model, in the order the frontend has always received them
+EXPECTED_KEYS = [
+    (HazardZone, ['h3CellId', 'riskLevel', 'riskScore', 'intensity', 'confidence', 'affectedPopulation', 'buildingsAtRisk', 'latestDetection', 'windSpeed', 'lastUpdated']),
+    (EmergencyUnit, ['unitId', 'callSign', 'unitType', 'status', 'currentLocation', 'lastLocationUpdate', 'capacity', 'equipment']),
+    (EvacuationRoute, ['routeId', 'originH3', 'destinationH3', 'routeGeometry', 'distanceKm', 'estimatedTimeMinutes', 'capacityPerHour', 'status', 'lastUpdated']),
+    (Building, ['buildingId', 'address', 'buildingType', 'occupancy', 'h3Cell', 'evacuationStatus', 'lastStatusUpdate']),
+    (Incident, ['incidentId', 'incidentType', 'locationH3', 'reportedAt', 'status', 'severity', 'description']),
+    (EvacuationOrder, ['orderId', 'zone', 'orderType', 'authorizedBy', 'timestamp', 'status', 'publicMessage', 'affectedPopulation']),
+    (DispatchRecord, ['recordId', 'unit', 'incident', 'dispatchedBy', 'dispatchTime', 'status']),
+    (NotificationRecord, ['notificationId', 'order', 'channel', 'sentAt', 'status']),
+    (RouteUsage, ['usageId', 'route', 'timestamp', 'vehiclesPerHour', 'averageSpeed']),
+    (ComplianceMetric, ['metricId', 'order', 'timestamp', 'complianceRate', 'populationEvacuated']),
+    (IncidentUpdate, ['updateId', 'incident', 'timestamp', 'status', 'notes', 'updatedBy']),
+]
+
+
+def _example(cls: type, dates: Optional[datetime] = REPORTED) -> Any:
+    """An instance with every field set, nested models included"""
+    hints = get_type_hints(cls)
+    values = {}
+    for f in fields(cls):
+        hint = hints[f.name]
+        if isinstance(hint, type) and issubclass(hint, SerializableModel):
+            values[f.name] = _example(hint, dates)
+        elif hint == Optional[datetime]:
+            values[f.name] = dates
+        elif hint in (int, float):
+            values[f.name] = hint(3)
+        elif hint is str:
+            values[f.name] = f.name
+        else:
+            values[f.name] = ["ladder"]
+    return cls(**values)
+
+
+class TestSerialization:
+    """camelCase serialization of the disaster models"""
+
+    @pytest.mark.parametrize("cls,keys", EXPECTED_KEYS, ids=[cls.__name__ for cls, _ in EXPECTED_KEYS])
+    def test_keys_and_order_are_pinned(self, cls: type, keys: list) -> None:
+        assert list(_example(cls).to_dict()) == keys
+
+    @pytest.mark.parametrize("dates", [REPORTED, None])
+    @pytest.mark.parametrize("cls", [cls for cls, _ in EXPECTED_KEYS], ids=lambda cls: cls.__name__)
+    def test_json_matches_dict(self, cls: type, dates: Optional[datetime]) -> None:
+        model = _example(cls, dates)
+
+        encoded = model.to_json()
+
+        assert json.loads(encoded) == model.to_dict()
+        assert list(json.loads(encoded)) == list(model.to_dict())
+
+    def test_values_are_converted(self) -> None:
+        order = _example(EvacuationOrder)
+
+        result = order.to_dict()
+
+        assert result["timestamp"] == REPORTED.isoformat()
+        assert result["zone"]["h3CellId"] == "h3_cell_id"
+        assert result["zone"]["lastUpdated"] == REPORTED.isoformat()
+        assert _example(Incident, None).to_dict()["reportedAt"] is None
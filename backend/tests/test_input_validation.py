@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+from werkzeug.exceptions import BadRequest
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import input_validation
+from input_validation import InputValidator, validate_api_key, validate_email
+
+
+class TestInputValidation:
+    """Validators reject bad input with BadRequest"""
+
+    @pytest.mark.parametrize("value", [["user@example.com"], {"email": "user@example.com"}, None])
+    def test_unhashable_or_non_string_email_is_rejected(self, value) -> None:
+        with pytest.raises(BadRequest):
+            validate_email(value)
+
+    def test_credentials_and_emails_are_not_memoized(self) -> None:
+        """Validated values are never kept in a cache"""
+        assert not [name for name, value in vars(input_validation).items() if hasattr(value, "cache_info")]
+        assert validate_api_key(" abcdefghijk ") == "abcdefghijk"
+        with pytest.raises(BadRequest):
+            validate_api_key(["abcdefghijk"])
+
+    def test_input_validator_keeps_the_original_api(self) -> None:
+        assert InputValidator.validate_email("User@Example.com") == "user@example.com"
+        assert InputValidator.sanitize_json({"name": "<b>x</b>"}) == {"name": "bx/b"}
+        assert InputValidator.validate_coordinates(10.0, 20.0) == (10.0, 20.0)
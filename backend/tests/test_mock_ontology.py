@@ -0,0 +1,132 @@
+import json
+import os
+import sys
+import threading
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_ontology
+from mock_ontology import Action, AuditLog, ChallengeEvacuationOrder, ChallengeHazardZone, OntologyRegistry, ontology_object
+
+
+def _registry_with_zones(count: int = 4) -> tuple:
+    registry = OntologyRegistry()
+    zones = [ChallengeHazardZone(h3_cell_id=f"cell-{i}", risk_level="low") for i in range(count)]
+    registry.register_objects(zones)
+    return registry, zones
+
+
+class TestRegistrySearch:
+    """Registry search stays consistent with in-place object updates"""
+
+    def test_indexed_search_after_attribute_write(self) -> None:
+        """A plain write to an indexed field moves the object between index buckets"""
+        registry, zones = _registry_with_zones()
+
+        zones[2].risk_level = "critical"
+
+        assert registry.search_objects("ChallengeHazardZone", risk_level="critical") == [zones[2]]
+        low = registry.search_objects("ChallengeHazardZone", risk_level="low")
+        assert zones[2] not in low
+        assert len(low) == 3
+
+    def test_column_search_after_attribute_write(self) -> None:
+        """A plain write to a non-indexed field reaches the cached column store"""
+        registry, zones = _registry_with_zones()
+        # First search builds the column store for the type
+        assert registry.search_objects("ChallengeHazardZone", status="inactive") == zones
+
+        zones[0].status = "active"
+
+        assert registry.search_objects("ChallengeHazardZone", status="active") == [zones[0]]
+        assert registry.search_objects("ChallengeHazardZone", status="inactive") == zones[1:]
+
+
+class TestAuditLog:
+    """Shared audit log row bookkeeping"""
+
+    def test_concurrent_appends_return_own_rows(self) -> None:
+        """Each append gets back the row holding its own entry"""
+        log = AuditLog(maxlen=None)
+        mismatches = []
+
+        def record(user: str) -> None:
+            for _ in range(500):
+                row = log.append(user, "action", user, {})
+                if log.rows_at([row])[0].user != user:
+                    mismatches.append(row)
+
+        threads = [threading.Thread(target=record, args=(f"user-{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not mismatches
+        assert len(log) == 2000
+
+    def test_bounded_log_drops_oldest_rows(self) -> None:
+        """Rows stay stable after trimming and dropped rows are skipped"""
+        log = AuditLog(maxlen=10)
+        rows = [log.append(i, "action", "user", {}) for i in range(25)]
+
+        assert len(log) <= 10
+        assert log.dropped == 25 - len(log)
+        assert log.first_row == log.dropped
+        assert log.rows_at([rows[0]]) == []
+        assert log.entries_for(24)[0]["action"] == "action"
+        assert rows == list(range(25))
+
+    def test_default_log_keeps_every_entry(self) -> None:
+        log = AuditLog()
+        for i in range(1000):
+            log.append(i, "action", "user", {})
+
+        assert len(log) == 1000
+        assert log.dropped == 0
+
+    def test_object_trail_is_pruned_with_the_log(self, monkeypatch) -> None:
+        """An object's row list forgets rows the bounded log dropped"""
+        monkeypatch.setattr(mock_ontology, "audit_log", AuditLog(maxlen=10))
+        order = ChallengeEvacuationOrder(hazard_zone_id="cell-0")
+        for i in range(25):
+            order._audit_action(f"review-{i}", "inspector")
+
+        trail = order.get_audit_trail()
+
+        assert len(order._audit_trail) == len(trail) == len(mock_ontology.audit_log)
+        assert trail[-1]["action"] == "review-24"
+
+    def test_audit_trail_is_json_serializable(self) -> None:
+        """Entries recorded with and without details serialize like plain dicts"""
+        order = ChallengeEvacuationOrder(hazard_zone_id="cell-0")
+        order._audit_action("review", "inspector")
+        order.cancel_order("contained", "commander")
+
+        trail = order.get_audit_trail()
+
+        assert [entry["details"] for entry in trail][0] == {}
+        assert all(type(entry["details"]) is dict for entry in trail)
+        json.dumps(trail, default=str)
+
+
+class TestActionRoles:
+    """@Action roles are recorded on the class that defines them"""
+
+    def test_undecorated_class_actions_do_not_leak(self) -> None:
+        class Plain:
+            @Action(requires_role="auditor")
+            def review(self) -> None:
+                pass
+
+        @ontology_object
+        class Decorated:
+            @Action(requires_role="dispatcher")
+            def dispatch(self) -> None:
+                pass
+
+        assert Decorated._ACTION_ROLES == {"dispatch": "dispatcher"}
+        assert not hasattr(Plain, "_ACTION_ROLES")
+        assert Plain.review._is_action and Plain.review._requires_role == "auditor"
+        assert ChallengeHazardZone._ACTION_ROLES["update_risk_assessment"] == "risk_assessor"
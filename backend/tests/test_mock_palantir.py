@@ -0,0 +1,41 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from mock_palantir import DataFrame, col, generate_mock_firms_data
+
+
+class TestMockGenerators:
+    """Mock dataset generators behave the same on every call"""
+
+    def test_firms_acquisition_times_follow_the_clock(self) -> None:
+        first = generate_mock_firms_data()
+        time.sleep(0.01)
+        second = generate_mock_firms_data()
+
+        assert second['acq_date'].iloc[0] > first['acq_date'].iloc[0]
+        assert second['brightness'].equals(first['brightness'])
+
+    def test_each_call_reseeds_numpy(self) -> None:
+        generate_mock_firms_data()
+        first = np.random.random()
+        generate_mock_firms_data()
+
+        assert np.random.random() == first
+
+
+class TestColumnExpressions:
+    """col() comparisons evaluate against scalars and other columns"""
+
+    def test_column_compared_with_column(self) -> None:
+        df = DataFrame(pd.DataFrame({"a": [1, 5, 3], "b": [2, 4, 3]}))
+
+        kept = df.filter(col("a") >= col("b"))
+
+        assert kept._df["a"].tolist() == [5, 3]
@@ -0,0 +1,105 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import mock_transforms
+
+
+class TestCellJoins:
+    """h3_cell join keys for mock decimal IDs and real hex H3 IDs"""
+
+    def test_hex_cell_ids_join_as_strings(self) -> None:
+        left = pd.DataFrame({'h3_cell': ['8928308280fffff', '8928308280bffff'], 'x': [1, 2]})
+        weather = pd.DataFrame({'h3_cell': ['8928308280bffff', '8928308280fffff'], 'wind_speed': [5.0, 7.0]})
+
+        joined = mock_transforms._join_on_cell(left, weather)
+
+        assert joined['wind_speed'].tolist() == [7.0, 5.0]
+        assert mock_transforms._cell_strings(joined['h3_cell']).tolist() == left['h3_cell'].tolist()
+
+    def test_decimal_cell_ids_join_as_integers(self) -> None:
+        left = pd.DataFrame({'h3_cell': np.array([892830828400001, 892830828400002], dtype=np.int64)})
+        weather = pd.DataFrame({'h3_cell': ['892830828400002', '892830828400001'], 'wind_speed': [5.0, 7.0]})
+
+        joined = mock_transforms._join_on_cell(left, weather)
+
+        assert joined['wind_speed'].tolist() == [7.0, 5.0]
+        assert pd.api.types.is_integer_dtype(joined['h3_cell'])
+
+    def test_decimal_ids_with_leading_zeros_round_trip(self) -> None:
+        """IDs that would not survive an int64 round trip stay strings"""
+        cells = pd.Series(['0123', '892830828400001'])
+
+        keys = mock_transforms._cell_keys(cells)
+
+        assert not pd.api.types.is_integer_dtype(keys)
+        assert mock_transforms._cell_strings(keys).tolist() == ['0123', '892830828400001']
+        assert pd.api.types.is_integer_dtype(mock_transforms._cell_keys(pd.Series(['0', '123'])))
+
+    def test_in_place_dimension_update_reaches_the_next_join(self) -> None:
+        """The dimension frame is re-indexed per join, so in-place edits are seen"""
+        left = pd.DataFrame({'h3_cell': np.array([892830828400001], dtype=np.int64)})
+        weather = pd.DataFrame({'h3_cell': ['892830828400001'], 'wind_speed': [5.0]})
+        assert mock_transforms._join_on_cell(left, weather)['wind_speed'].tolist() == [5.0]
+
+        weather.loc[0, 'wind_speed'] = 9.0
+
+        assert mock_transforms._join_on_cell(left, weather)['wind_speed'].tolist() == [9.0]
+
+    @pytest.mark.parametrize("unique", [True, False])
+    def test_shared_columns_are_suffixed_like_merge(self, unique) -> None:
+        left = pd.DataFrame({'h3_cell': ['892830828400001', '892830828400002'], 'timestamp': [1, 2]})
+        dimension = pd.DataFrame({
+            'h3_cell': ['892830828400001', '892830828400002' if unique else '892830828400001'],
+            'timestamp': [3, 4]
+        })
+
+        joined = mock_transforms._join_on_cell(left, dimension)
+        expected = pd.merge(left, dimension, on='h3_cell', how='left')
+
+        assert list(joined.columns) == list(expected.columns) == ['h3_cell', 'timestamp_x', 'timestamp_y']
+        assert joined['timestamp_y'].fillna(0).tolist() == expected['timestamp_y'].fillna(0).tolist()
+
+
+def _firms_batch(rows: int = 5000, cells: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    brightness = rng.uniform(300, 500, rows)
+    brightness[rng.random(rows) < 0.05] = np.nan
+    return pd.DataFrame({
+        'h3_cell': (892830828400000 + rng.integers(0, cells, rows)).astype(np.int64),
+        'brightness': brightness,
+        'latitude': rng.uniform(32.5, 42.5, rows),
+        'longitude': rng.uniform(-124.5, -114.5, rows),
+    })
+
+
+def _pandas_aggregate(firms_df: pd.DataFrame) -> pd.DataFrame:
+    return firms_df.groupby('h3_cell').agg(mock_transforms._FIRE_CELL_AGGREGATES).reset_index()
+
+
+class TestFireCellAggregation:
+    """Fast aggregation paths return the same frame as the pandas groupby"""
+
+    def test_array_kernel_matches_pandas(self) -> None:
+        firms_df = _firms_batch()
+        assert mock_transforms._has_gapless_coordinates(firms_df)
+
+        result = mock_transforms._aggregate_fire_cells_kernel(firms_df)
+
+        pd.testing.assert_frame_equal(result, _pandas_aggregate(firms_df), check_dtype=False)
+
+    def test_dask_partitions_match_pandas(self, monkeypatch) -> None:
+        pytest.importorskip("dask.dataframe")
+        firms_df = _firms_batch()
+        monkeypatch.setattr(mock_transforms, "DASK_MIN_ROWS", 1)
+        monkeypatch.setattr(mock_transforms, "DASK_PARTITIONS", 4)
+
+        result = mock_transforms._aggregate_fire_cells(firms_df)
+
+        pd.testing.assert_frame_equal(result, _pandas_aggregate(firms_df), check_dtype=False)
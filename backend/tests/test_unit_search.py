@@ -0,0 +1,101 @@
+import os
+import random
+import sys
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+h3 = pytest.importorskip("h3")
+
+from ontology.unit_search import h3_cells_within, nearest_available_units
+
+ORIGIN_CELL = "8928308280fffff"
+
+
+class _UnitQuery:
+    """In-memory stand-in for an ontology objects() query over a fixed fleet"""
+
+    def __init__(self, units: List[Any], log: List[List[str]]) -> None:
+        self._units = units
+        self._log = log
+
+    def filter(self, status: str = None, current_location__in: List[str] = None) -> "_UnitQuery":
+        units = self._units
+        if status is not None:
+            units = [unit for unit in units if unit.status == status]
+        if current_location__in is not None:
+            self._log.append(list(current_location__in))
+            cells = set(current_location__in)
+            units = [unit for unit in units if unit.current_location in cells]
+        return _UnitQuery(units, self._log)
+
+    def __iter__(self):
+        return iter(self._units)
+
+
+def _objects(fleet: List[Any], log: List[List[str]] = None):
+    log = [] if log is None else log
+    return lambda: _UnitQuery(fleet, log)
+
+
+def _distance_from(cell: str):
+    origin = h3.cell_to_latlng(cell)
+    return lambda c: h3.great_circle_distance(origin, h3.cell_to_latlng(c), unit="m")
+
+
+def _fleet(cells: List[str], status: str = "available") -> List[Any]:
+    return [SimpleNamespace(unit_id=f"unit-{i}", status=status, current_location=c) for i, c in enumerate(cells)]
+
+
+class TestNearestAvailableUnits:
+    """Ring search returns the same units as a full distance sort"""
+
+    def test_unit_just_outside_the_disk_corners_is_found(self) -> None:
+        distance = _distance_from(ORIGIN_CELL)
+        # Three units on the far corners of ring 8, one on the near side of ring 9:
+        # the doubling search reaches ring 8 first and must still look one ring further
+        corners = sorted(h3.grid_ring(ORIGIN_CELL, 8), key=distance)[-3:]
+        near_side = min(h3.grid_ring(ORIGIN_CELL, 9), key=distance)
+        assert distance(near_side) < distance(corners[0])
+        fleet = _fleet(corners + [near_side])
+
+        found = nearest_available_units(_objects(fleet), ORIGIN_CELL, 3, 5000)
+
+        expected = sorted(fleet, key=lambda unit: distance(unit.current_location))[:3]
+        assert [unit.unit_id for unit in found] == [unit.unit_id for unit in expected]
+        assert "unit-3" in {unit.unit_id for unit in found}
+
+    def test_matches_a_full_distance_sort(self) -> None:
+        distance = _distance_from(ORIGIN_CELL)
+        disk = sorted(h3.grid_disk(ORIGIN_CELL, 40))
+        rng = random.Random(11)
+        for _ in range(25):
+            fleet = _fleet(rng.sample(disk, rng.randint(0, 12)))
+
+            found = nearest_available_units(_objects(fleet), ORIGIN_CELL, 3, 5000)
+
+            in_range = [unit for unit in fleet if distance(unit.current_location) < 5000]
+            expected = sorted(in_range, key=lambda unit: distance(unit.current_location))[:3]
+            assert [unit.unit_id for unit in found] == [unit.unit_id for unit in expected]
+
+    def test_units_beyond_the_radius_or_busy_are_skipped(self) -> None:
+        distance = _distance_from(ORIGIN_CELL)
+        outside = min((c for c in h3.grid_ring(ORIGIN_CELL, 40) if distance(c) > 5000), key=distance)
+        busy = _fleet([ORIGIN_CELL], status="dispatched")
+
+        found = nearest_available_units(_objects(_fleet([outside]) + busy), ORIGIN_CELL, 3, 5000)
+
+        assert found == []
+
+    def test_nearby_fleet_is_found_without_searching_the_whole_radius(self) -> None:
+        fleet = _fleet(list(h3.grid_ring(ORIGIN_CELL, 1))[:3])
+        queried: List[List[str]] = []
+
+        found = nearest_available_units(_objects(fleet, queried), ORIGIN_CELL, 3, 5000)
+
+        assert len(found) == 3
+        assert sum(map(len, queried)) < len(h3_cells_within(ORIGIN_CELL, 5000))
@@ -0,0 +1,140 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+
+from api import validation_api
+from api.validation_api import VALIDATOR_TIMEOUT_SECONDS, run_validators, single_flight, validate_data_sources, validation_bp
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(validation_bp)
+    return app.test_client()
+
+
+class TestValidationResponses:
+    """Response encoding for the validation endpoints"""
+
+    def test_compare_echoes_integers_beyond_64_bits(self, client) -> None:
+        """Payloads orjson cannot encode fall back to the json module"""
+        big = 2 ** 64 + 1
+        # A non-boolean success never matches the backend, so the payload is echoed back
+        response = client.post('/api/validation/compare', json={"success": "unknown", "count": big})
+
+        assert response.status_code == 200
+        assert response.get_json()["frontend_results"]["count"] == big
+
+    def test_weak_if_none_match_revalidates(self, client) -> None:
+        """If-None-Match is compared weakly, so a W/ validator still gets a 304"""
+        etag = client.get('/api/validation/api-endpoints').headers['ETag'].strip('"')
+
+        response = client.get('/api/validation/api-endpoints', headers={'If-None-Match': f'W/"{etag}"'})
+
+        assert response.status_code == 304
+
+
+    def test_data_sources_report_booleans(self) -> None:
+        """Every category reports a bool has_geojson and success stays a bool"""
+        result = validate_data_sources(1.0)
+
+        assert type(result["success"]) is bool
+        assert all(type(source["has_geojson"]) is bool for source in result["data_sources"].values())
+
+
+class TestSingleFlight:
+    """Concurrent validator calls share one run, each stamped with its own timestamp"""
+
+    def test_concurrent_callers_share_one_run(self) -> None:
+        release = threading.Event()
+        started = threading.Event()
+        calls: List[Optional[float]] = []
+
+        @single_flight
+        def validator(now: Optional[float] = None) -> Dict[str, Any]:
+            calls.append(now)
+            started.set()
+            release.wait(VALIDATOR_TIMEOUT_SECONDS / 2)
+            return {"success": True, "timestamp": now}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        leader = threading.Thread(target=lambda: results.setdefault("leader", validator(1.0)))
+        leader.start()
+        started.wait(1)
+        follower = threading.Thread(target=lambda: results.setdefault("follower", validator(2.0)))
+        follower.start()
+        # Give the follower time to find the leader's run before it completes
+        follower.join(VALIDATOR_TIMEOUT_SECONDS / 5)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert calls == [1.0]
+        assert results["leader"] == {"success": True, "timestamp": 1.0}
+        assert results["follower"] == {"success": True, "timestamp": 2.0}
+
+    def test_follower_gives_up_at_the_deadline(self) -> None:
+        release = threading.Event()
+        started = threading.Event()
+
+        @single_flight
+        def validator(now: Optional[float] = None) -> Dict[str, Any]:
+            started.set()
+            release.wait(5)
+            return {"success": True, "timestamp": now}
+
+        leader = threading.Thread(target=validator, args=(1.0,))
+        leader.start()
+        started.wait(1)
+        try:
+            follower = validator(1.0)
+        finally:
+            release.set()
+            leader.join()
+
+        assert follower == {"success": False, "timestamp": 1.0, "error": "timeout"}
+
+
+class TestRunValidators:
+    """Validator deadlines under concurrent load"""
+
+    def test_queue_time_does_not_count_against_the_deadline(self, monkeypatch) -> None:
+        """A validator waiting for a worker still gets its full deadline once started"""
+        monkeypatch.setattr(validation_api, "_VALIDATOR_POOL", ThreadPoolExecutor(max_workers=1))
+
+        def slow(now: Optional[float] = None) -> Dict[str, Any]:
+            time.sleep(VALIDATOR_TIMEOUT_SECONDS * 0.6)
+            return {"success": True, "timestamp": now}
+
+        results = run_validators({"first": slow, "second": slow}, 1.0)
+
+        assert results == {
+            "first": {"success": True, "timestamp": 1.0},
+            "second": {"success": True, "timestamp": 1.0}
+        }
+
+    def test_concurrent_comprehensive_requests_complete(self, client) -> None:
+        statuses: List[Any] = []
+
+        def request() -> None:
+            body = client.get('/api/validation/comprehensive').get_json()
+            statuses.append([component.get("error") for component in body["components"].values()])
+
+        threads = [threading.Thread(target=request) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(statuses) == 16
+        assert all("timeout" not in errors for errors in statuses)
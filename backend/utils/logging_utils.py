@@ -0,0 +1,15 @@
+"""
+Logging helpers shared by the mock Foundry modules and the ontology implementations.
+"""
+
+import logging
+from typing import Any
+
+
+def info_enabled(logger: Any) -> bool:
+    """Whether logger would emit INFO records as currently configured, so costly log
+    arguments and per-item log loops can be skipped; loggers without level checks always emit"""
+    try:
+        return logger.is_enabled_for(logging.INFO)
+    except AttributeError:
+        return True